@@ -1,14 +1,15 @@
+import base64
 import dash
-from dash import dcc, html, Input, Output
+import os
+from dash import dcc, html, Input, Output, State, Patch
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
 import numpy as np
 from scipy import stats
 from datetime import datetime
-
-# Set the default theme to a modern style
-pio.templates.default = "plotly_white"
+from functools import lru_cache
+from types import MappingProxyType
 
 # Define color scheme
 COLORS = {
@@ -20,46 +21,120 @@ COLORS = {
     'right': '#364650'  # Secondary color for right side
 }
 
+# Column types for data.csv, so dates and measurements are parsed in the single read pass
+DATE_COLUMNS = ["date", "date_of_birth", "injury_date"]
+MEASUREMENT_COLUMNS = [
+    "knee_extension_force_left", "knee_extension_lever_left",
+    "knee_extension_force_right", "knee_extension_lever_right",
+    "knee_flexion_force_left", "knee_flexion_lever_left",
+    "knee_flexion_force_right", "knee_flexion_lever_right",
+    "calf_force_left", "calf_force_right", "body_mass",
+    "sl_jump_height_left", "sl_jump_height_right",
+    "rsid_left", "rsid_right"
+]
+
 # Load data
-df = pd.read_csv("data.csv")
-df["date"] = pd.to_datetime(df["date"])
-df["date_of_birth"] = pd.to_datetime(df["date_of_birth"])
-df["injury_date"] = pd.to_datetime(df["injury_date"])
-
-# Calculate derived metrics for both sides
-df["knee_extension_left"] = (df["knee_extension_force_left"] * df["knee_extension_lever_left"]) / df["body_mass"]
-df["knee_extension_right"] = (df["knee_extension_force_right"] * df["knee_extension_lever_right"]) / df["body_mass"]
-df["knee_flexion_left"] = (df["knee_flexion_force_left"] * df["knee_flexion_lever_left"]) / df["body_mass"]
-df["knee_flexion_right"] = (df["knee_flexion_force_right"] * df["knee_flexion_lever_right"]) / df["body_mass"]
-df["calf_strength_left"] = (df["calf_force_left"] / 9.81) / df["body_mass"] * 100  # Convert to % bodyweight
-df["calf_strength_right"] = (df["calf_force_right"] / 9.81) / df["body_mass"] * 100  # Convert to % bodyweight
+df = pd.read_csv(
+    "data.csv",
+    dtype={"athlete": "category", **{column: "float32" for column in MEASUREMENT_COLUMNS}},
+    parse_dates=DATE_COLUMNS,
+    date_format="%Y-%m-%d"
+)
+
+# Calculate derived metrics for both sides in a single vectorized block
+source = df[[
+    "knee_extension_force_left", "knee_extension_lever_left",
+    "knee_extension_force_right", "knee_extension_lever_right",
+    "knee_flexion_force_left", "knee_flexion_lever_left",
+    "knee_flexion_force_right", "knee_flexion_lever_right",
+    "calf_force_left", "calf_force_right",
+    "body_mass"
+]].to_numpy(dtype=np.float64)
+body_mass = source[:, 10:11]
+derived = np.empty((len(df), 6))
+derived[:, 0:4] = (source[:, 0:8:2] * source[:, 1:8:2]) / body_mass  # Torque per kg
+derived[:, 4:6] = (source[:, 8:10] / 9.81) / body_mass * 100  # Convert to % bodyweight
+df[["knee_extension_left", "knee_extension_right", "knee_flexion_left", "knee_flexion_right",
+    "calf_strength_left", "calf_strength_right"]] = derived
+
+# Raw force and lever readings are only needed for the derived metrics above
+df = df.drop(columns=[c for c in df.columns if c.endswith(("_force_left", "_force_right", "_lever_left", "_lever_right"))])
 
 # Calculate asymmetry indices (percentage difference)
 def calculate_asymmetry(left, right):
-    return ((right - left) / ((left + right) / 2)) * 100
+    """Percentage difference of right vs left, using in-place ufuncs to avoid temporaries"""
+    left = np.asarray(left, dtype=np.float64)
+    right = np.asarray(right, dtype=np.float64)
+    asymmetry = np.subtract(right, left)
+    mean = np.add(left, right)
+    mean *= 0.5
+    asymmetry /= mean
+    asymmetry *= 100
+    return asymmetry
+
+ASYMMETRY_PAIRS = {
+    "knee_extension_asymmetry": ("knee_extension_left", "knee_extension_right"),
+    "knee_flexion_asymmetry": ("knee_flexion_left", "knee_flexion_right"),
+    "calf_strength_asymmetry": ("calf_strength_left", "calf_strength_right"),
+    "jump_height_asymmetry": ("sl_jump_height_left", "sl_jump_height_right"),
+    "rsid_asymmetry": ("rsid_left", "rsid_right")
+}
+left_values = df[[left for left, _ in ASYMMETRY_PAIRS.values()]].to_numpy(dtype=np.float64)
+right_values = df[[right for _, right in ASYMMETRY_PAIRS.values()]].to_numpy(dtype=np.float64)
+df[list(ASYMMETRY_PAIRS)] = calculate_asymmetry(left_values, right_values)
+
+# Calculate time since injury and birth once for every test session, as whole days in one NumPy pass;
+# kept as float so a missing date stays NaN
+elapsed_days = np.floor(
+    (df["date"].to_numpy()[:, None] - df[["injury_date", "date_of_birth"]].to_numpy()) / np.timedelta64(1, "D")
+)
+df["injury_days"] = elapsed_days[:, 0]
+df["weeks_since_injury"] = elapsed_days[:, 0] / 7.0
+df["age_years"] = elapsed_days[:, 1] / 365.25
+
+# Downcast to the narrowest types the dashboard needs
+float_cols = df.select_dtypes("float64").columns
+df[float_cols] = df[float_cols].astype(np.float32)
+df[DATE_COLUMNS] = df[DATE_COLUMNS].astype("datetime64[s]")
+
+# Presort by athlete then date so every per-athlete slice is already in date order
+df = df.sort_values(["athlete", "date"], ignore_index=True)
 
-df["knee_extension_asymmetry"] = calculate_asymmetry(df["knee_extension_left"], df["knee_extension_right"])
-df["knee_flexion_asymmetry"] = calculate_asymmetry(df["knee_flexion_left"], df["knee_flexion_right"])
-df["calf_strength_asymmetry"] = calculate_asymmetry(df["calf_strength_left"], df["calf_strength_right"])
-df["jump_height_asymmetry"] = calculate_asymmetry(df["sl_jump_height_left"], df["sl_jump_height_right"])
-df["rsid_asymmetry"] = calculate_asymmetry(df["rsid_left"], df["rsid_right"])
+# Per-athlete frames, built once at startup
+GROUPS = {name: g.reset_index(drop=True) for name, g in df.groupby("athlete", sort=False, observed=True)}
+
+# Row position of each (athlete, date) within its GROUPS frame
+DATE_INDEX = {(name, date): i for name, g in GROUPS.items() for i, date in enumerate(g["date"])}
 
 # Create Dash app
 app = dash.Dash(__name__)
 app.title = "Athlete Dashboard"
 
 # Dropdown options - filter out any null values
-athletes = sorted(df["athlete"].dropna().unique())
+athletes = sorted(df["athlete"].cat.categories)
 dates = sorted(df["date"].unique())
 
-def get_color_gradient(percentage, side):
-    """Create a modern gradient effect for donut charts"""
-    if side == 'left':
-        # Use the same blue as the line graphs
-        return ['#01ADD8', '#018DB8']  # Primary blue colors
-    else:
-        # Use darker blue for right side
-        return ['#364650', '#263640']  # Secondary blue colors
+# Header and asymmetry text for every (athlete, date), rendered clientside from a store
+SUMMARY_LOOKUP = {
+    f"{row.athlete}|{row.date:%Y-%m-%d}": [
+        row.athlete,
+        f"Age: {row.age_years:.1f} years | Injury Date: {row.injury_date:%d/%m/%Y} | Weeks Post-Injury: {row.injury_days/7:.1f}",
+        f"{row.jump_height_asymmetry:.1f}%",
+        f"{row.rsid_asymmetry:.1f}%"
+    ]
+    for row in df.itertuples(index=False)
+}
+
+# Donut gradient colors per side: the line graphs' blue on the left, a darker blue on the right
+GRADIENT_COLORS = {
+    'left': ('#01ADD8', '#018DB8'),
+    'right': ('#364650', '#263640')
+}
+
+@lru_cache(maxsize=8)
+def hex_to_rgb(color):
+    """Parse a '#RRGGBB' color into an (r, g, b) tuple"""
+    return tuple(int(color[i:i+2], 16) for i in (1, 3, 5))
 
 def get_glow_opacity(value, target, threshold=0.7):
     """Calculate glow opacity based on value relative to target"""
@@ -70,92 +145,111 @@ def get_glow_opacity(value, target, threshold=0.7):
     else:
         return 0.05  # Base glow
 
-# Common style for all figures
-def get_common_layout():
-    return {
-        "font": {"family": "Helvetica, Arial, sans-serif", "color": COLORS['secondary']},
-        "paper_bgcolor": COLORS['white'],
-        "plot_bgcolor": COLORS['white'],
-        "margin": {"t": 30, "b": 30, "l": 30, "r": 30},
-        "xaxis": {
-            "showgrid": True,
-            "gridcolor": "rgba(1, 173, 216, 0.1)",
-            "title": {"font": {"family": "Helvetica, Arial, sans-serif"}}
-        },
-        "yaxis": {
-            "showgrid": True,
-            "gridcolor": "rgba(1, 173, 216, 0.1)",
-            "title": {"font": {"family": "Helvetica, Arial, sans-serif"}}
-        }
+# Serialize figures with orjson; Dash encodes callback outputs through plotly.io's JSON engine
+pio.json.config.default_engine = "orjson"
+
+# Donut geometry in polar radius units
+DONUT_HOLE = 0.7
+DONUT_OUTER = 1.0
+DONUT_GLOW = 0.06
+
+DONUT_POLAR = dict(
+    bgcolor=COLORS['white'],
+    radialaxis=dict(visible=False, range=[0, DONUT_OUTER + DONUT_GLOW]),
+    angularaxis=dict(visible=False, rotation=90, direction="clockwise")
+)
+
+# Donut measurement columns and their targets (jump height in cm, RSI)
+DONUT_COLUMNS = ["sl_jump_height_left", "sl_jump_height_right", "rsid_left", "rsid_right"]
+DONUT_TARGETS = np.array([17.0, 17.0, 0.52, 0.52], dtype=np.float32)
+
+# Trace and layout styles shared by every callback
+LEFT_LINE = dict(color=COLORS['left'], width=5)
+RIGHT_LINE = dict(color=COLORS['right'], width=5)
+LEFT_MARKER = dict(size=12, color=COLORS['left'], line=dict(width=3, color=COLORS['white']))
+RIGHT_MARKER = dict(size=12, color=COLORS['right'], line=dict(width=3, color=COLORS['white']))
+# Dicts unpacked into every figure are read-only views so no build step can mutate them for the next one
+LEFT_TRACE = MappingProxyType(dict(mode="lines+markers", name="Left", legendgroup="Left", line=LEFT_LINE, marker=LEFT_MARKER))
+RIGHT_TRACE = MappingProxyType(dict(mode="lines+markers", name="Right", legendgroup="Right", line=RIGHT_LINE, marker=RIGHT_MARKER))
+DONUT_TITLE = {
+    "text": "",
+    "font": {"size": 16},
+    "y": 0.95,
+    "x": 0.5,
+    "xanchor": "center"
+}
+DONUT_ANNOTATION_FONT = dict(size=32)
+DONUT_HEADING_STYLE = {
+    "textAlign": "center",
+    "color": COLORS['secondary'],
+    "marginBottom": "5px",
+    "fontSize": "16px",
+    "fontWeight": "bold",
+    "letterSpacing": "0.3px",
+    "fontFamily": "Helvetica, Arial, sans-serif"
+}
+ASYMMETRY_VALUE_STYLE = {
+    "textAlign": "center",
+    "color": COLORS['secondary'],
+    "fontSize": "18px",
+    "fontWeight": "bold",
+    "fontFamily": "Helvetica, Arial, sans-serif"
+}
+
+# Common style for all figures, registered once as a template layered on plotly_white
+pio.templates["dashboard"] = go.layout.Template(layout={
+    "font": {"family": "Helvetica, Arial, sans-serif", "color": COLORS['secondary']},
+    "paper_bgcolor": COLORS['white'],
+    "plot_bgcolor": COLORS['white'],
+    "margin": {"t": 30, "b": 30, "l": 30, "r": 30},
+    "xaxis": {
+        "showgrid": True,
+        "gridcolor": "rgba(1, 173, 216, 0.1)",
+        "zeroline": False
+    },
+    "yaxis": {
+        "showgrid": True,
+        "gridcolor": "rgba(1, 173, 216, 0.1)",
+        "zeroline": False
+    },
+    "legend": {
+        "yanchor": "top",
+        "y": 0.99,
+        "xanchor": "left",
+        "x": 0.01,
+        "bgcolor": COLORS['white'],
+        "bordercolor": "rgba(0,0,0,0)",
+        "font": {"size": 12}
     }
+})
+pio.templates.default = "plotly_white+dashboard"
+
+# Resolved default template, attached to figures built as raw dicts (they skip go.Figure's defaults)
+FIGURE_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
 
 def add_glow_effect(fig, x_values, y_values, color, opacity=0.2):
-    """Add a gradient glow effect around data points and lines"""
-    # Convert hex color to RGB for gradient creation
-    rgb = tuple(int(color[i:i+2], 16) for i in (1, 3, 5))
-    
-    # Add multiple gradient fills with decreasing opacity
-    opacities = [0.3, 0.2, 0.1, 0.05]
-    for i, op in enumerate(opacities):
-        y_offset = np.min(y_values) - (np.max(y_values) - np.min(y_values)) * 0.1 * i
-        fig.add_trace(go.Scatter(
-            x=x_values,
-            y=y_values,
-            mode='lines',
-            fill='tonexty' if i > 0 else 'tozeroy',
-            fillcolor=f'rgba{rgb + (op,)}',
-            line=dict(width=0),
-            showlegend=False,
-            hoverinfo='skip',
-            name=''
-        ))
-        if i < len(opacities) - 1:
-            # Add intermediate line for next fill layer
-            fig.add_trace(go.Scatter(
-                x=x_values,
-                y=[y_offset] * len(x_values),
-                mode='lines',
-                line=dict(width=0),
-                showlegend=False,
-                hoverinfo='skip',
-                name=''
-            ))
-    
-    # Add glow effect for the line
-    fig.add_trace(go.Scatter(
+    """Add a glow behind a line as a single wide, translucent line+marker trace"""
+    # Convert hex color to RGB for the translucent halo
+    rgb = hex_to_rgb(color)
+    glow_color = f'rgba{rgb + (opacity * 0.75,)}'
+
+    fig.add_trace(go.Scattergl(
         x=x_values,
         y=y_values,
-        mode='lines',
+        mode='lines+markers',
         line=dict(
-            color=color,
-            width=15,
-            shape='spline'
+            color=glow_color,
+            width=15
+        ),
+        marker=dict(
+            size=30,
+            color=glow_color,
+            line=dict(width=0)
         ),
-        opacity=opacity * 0.5,
         showlegend=False,
         hoverinfo='skip',
         name=''
     ))
-    
-    # Add glow effect for points
-    sizes = [20, 30, 40]  # Increasing sizes for outer layers
-    opacities = [opacity, opacity * 0.75, opacity * 0.5]  # Decreasing opacities
-    
-    for size, op in zip(sizes, opacities):
-        fig.add_trace(go.Scatter(
-            x=x_values,
-            y=y_values,
-            mode='markers',
-            marker=dict(
-                size=size,
-                color=color,
-                line=dict(width=0)
-            ),
-            opacity=op,
-            showlegend=False,
-            hoverinfo='skip',
-            name=''
-        ))
 
 def add_trend_glow(fig, x_values, y_values, color, opacity=0.2):
     """Add glow effect to trend lines"""
@@ -176,35 +270,186 @@ def add_trend_glow(fig, x_values, y_values, color, opacity=0.2):
 
 def add_donut_glow(fig, percentage, color):
     """Add modern glow effect to donut chart"""
-    # Add multiple layers of glow with decreasing opacity
-    sizes = [0.85, 0.9, 0.95]  # Increasing sizes for outer layers
-    
     if percentage >= 100:
-        # Add pronounced green glow for 100% achievement
-        opacities = [0.5, 0.4, 0.3]  # Higher opacities for green glow
+        # Pronounced green glow for 100% achievement
+        opacity = 0.5
         glow_color = '#2ecc71'  # Bright green color
     else:
         # Regular glow with original color
-        opacities = [0.2, 0.15, 0.1]  # Standard opacities
+        opacity = 0.2
         glow_color = color
-    
-    for size, opacity in zip(sizes, opacities):
-        fig.add_trace(go.Pie(
-            labels=["Glow"],
-            values=[percentage],
-            hole=size,
-            marker=dict(
-                colors=[glow_color],
-                line=dict(width=0)
-            ),
-            opacity=opacity,
+
+    # A single full ring slightly wider than the donut, drawn behind it
+    fig["data"].append(dict(
+        type="barpolar",
+        r=[DONUT_OUTER + DONUT_GLOW - DONUT_HOLE],
+        base=DONUT_HOLE,
+        theta=[180],
+        width=[360],
+        marker=dict(color=glow_color, line=dict(width=0)),
+        opacity=opacity,
+        showlegend=False,
+        hoverinfo='skip'
+    ))
+
+def add_donut_arcs(fig, achieved, remaining, color):
+    """Draw a donut as two barpolar arcs (achieved + remaining) starting at 12 o'clock"""
+    total = achieved + remaining
+    achieved_span = achieved / total * 360 if total > 0 else 0
+
+    arcs = [
+        ("Achieved", achieved, 0, achieved_span, color),
+        ("Remaining", remaining, achieved_span, 360 - achieved_span, COLORS['light_gray'])
+    ]
+    for label, value, start, span, arc_color in arcs:
+        fig["data"].append(dict(
+            type="barpolar",
+            r=[DONUT_OUTER - DONUT_HOLE],
+            base=DONUT_HOLE,
+            theta=[start + span / 2],
+            width=[span],
+            marker=dict(color=arc_color, line=dict(width=0)),
             showlegend=False,
-            textinfo='none',
-            hoverinfo='skip'
+            hovertemplate=f"{label}<br>{value:.2f}<extra></extra>"
         ))
 
+    fig["layout"]["polar"] = DONUT_POLAR
+
+# Layout shared by the strength line figures; fonts, colors and grid come from the template
+LINE_TITLE_FONT = {"size": 20, "weight": "bold"}
+AXIS_TITLE_FONT = {"size": 14}
+LINE_LAYOUT = MappingProxyType({
+    "xaxis": {"title": {"text": "Weeks Post-Injury", "font": AXIS_TITLE_FONT}},
+    "showlegend": True
+})
+
+def make_title(text):
+    """Centered line figure title; only the text differs between figures"""
+    return {"text": text, "font": LINE_TITLE_FONT, "y": 0.95, "x": 0.5, "xanchor": "center"}
+
+# Line figure templates: fully styled once at startup, data filled in per callback
+def target_line(y, text, dash, width, font_size):
+    """Full-width horizontal reference line as a layout shape plus its right-hand label annotation"""
+    shape = {
+        "type": "line", "xref": "x domain", "x0": 0, "x1": 1, "yref": "y", "y0": y, "y1": y,
+        "line": {"color": COLORS['secondary'], "dash": dash, "width": width}
+    }
+    annotation = {
+        "text": text, "xref": "x domain", "x": 1, "xanchor": "left", "yref": "y", "y": y, "yanchor": "middle",
+        "showarrow": False, "font": {"size": font_size}
+    }
+    return shape, annotation
+
+# Target and 70%-of-target reference lines for each strength figure, as static layout shapes/annotations
+EXTENSION_HLINES, EXTENSION_ANNOTATIONS = zip(
+    target_line(3.3, "Target: 3.3 N.m.kg⁻¹", "dash", 2, 12),
+    target_line(2.31, "70% Target: 2.31 N.m.kg⁻¹", "dot", 1, 10)
+)
+FLEXION_HLINES, FLEXION_ANNOTATIONS = zip(
+    target_line(2.0, "Target: 2.0 N.m.kg⁻¹", "dash", 2, 12),
+    target_line(1.4, "70% Target: 1.4 N.m.kg⁻¹", "dot", 1, 10)
+)
+CALF_HLINES, CALF_ANNOTATIONS = zip(
+    target_line(200, "Target: 200% BW", "dash", 2, 12),
+    target_line(140, "70% Target: 140% BW", "dot", 1, 10)
+)
+
+def build_line_fig(title, ytitle, hover_value, hlines=(), annotations=()):
+    """Build one styled strength line figure with empty glow and Left/Right traces"""
+    fig = go.Figure(layout={
+        **LINE_LAYOUT,
+        "title": make_title(title),
+        "yaxis": {"title": {"text": ytitle, "font": AXIS_TITLE_FONT}},
+        "shapes": list(hlines),
+        "annotations": list(annotations)
+    })
+
+    # Glow underlays first so the main traces draw on top
+    add_glow_effect(fig, [], [], COLORS['left'], opacity=0.2)
+    add_glow_effect(fig, [], [], COLORS['right'], opacity=0.2)
+
+    fig.add_trace(go.Scattergl(x=[], y=[], hovertemplate=hover_value + '<extra>Left</extra>', **LEFT_TRACE))
+    fig.add_trace(go.Scattergl(x=[], y=[], hovertemplate=hover_value + '<extra>Right</extra>', **RIGHT_TRACE))
+    return fig
+
+# Validated through go.Figure once, then kept as plain dicts so callbacks skip the validators
+EXTENSION_TEMPLATE = build_line_fig("Knee Extension", "Strength (N.m.kg⁻¹)", '%{y:.2f} N.m.kg⁻¹',
+                                    EXTENSION_HLINES, EXTENSION_ANNOTATIONS).to_dict()
+FLEXION_TEMPLATE = build_line_fig("Knee Flexion", "Strength (N.m.kg⁻¹)", '%{y:.2f} N.m.kg⁻¹',
+                                  FLEXION_HLINES, FLEXION_ANNOTATIONS).to_dict()
+CALF_TEMPLATE = build_line_fig("Seated Plantarflexion", "Strength (% Bodyweight)", '%{y:.1f}%% BW',
+                               CALF_HLINES, CALF_ANNOTATIONS).to_dict()
+
+# Longest series drawn per trace before LTTB downsampling kicks in
+MAX_PLOT_POINTS = 500
+
+def lttb_indices(x_values, y_values, n_out):
+    """Indices of a Largest-Triangle-Three-Buckets downsample of (x, y) to n_out points"""
+    n = len(x_values)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x_values = np.asarray(x_values, dtype=np.float64)
+    y_values = np.asarray(y_values, dtype=np.float64)
+
+    # First and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x_values[end:next_end].mean()
+        avg_y = y_values[end:next_end].mean()
+
+        # Keep the point forming the largest triangle with the previous pick and the next bucket's mean
+        areas = np.abs(
+            (x_values[selected] - avg_x) * (y_values[start:end] - y_values[selected])
+            - (x_values[selected] - x_values[start:end]) * (avg_y - y_values[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+
+    return indices
+
+def downsample_lines(x_values, left_values, right_values):
+    """Downsample long histories so each side ships at most MAX_PLOT_POINTS points"""
+    if len(x_values) <= MAX_PLOT_POINTS:
+        # Short histories keep every point and share the caller's x array
+        return [(x_values, left_values), (x_values, right_values)]
+
+    series = []
+    for y_values in (left_values, right_values):
+        keep = lttb_indices(x_values, y_values, MAX_PLOT_POINTS)
+        series.append((x_values[keep], y_values[keep]))
+    return series
+
+def typed_array(values):
+    """Encode values as a plotly.js typed-array spec (base64 float32) instead of a JSON number list"""
+    values = np.ascontiguousarray(values, dtype=np.float32)
+    return {"dtype": "f4", "bdata": base64.b64encode(values).decode("ascii")}
+
+def encode_lines(x_values, x_spec, left_values, right_values):
+    """Downsample and encode both sides; any side still on x_values reuses its encoding x_spec"""
+    return [(x_spec if x is x_values else typed_array(x), typed_array(y))
+            for x, y in downsample_lines(x_values, left_values, right_values)]
+
+def fill_line_template(template, series):
+    """Copy a line template dict and set its traces' encoded data (glow left, glow right, main left, main right)"""
+    return {
+        "data": [dict(trace, x=x, y=y) for trace, (x, y) in zip(template["data"], series * 2)],
+        "layout": template["layout"]
+    }
+
 # Layout
 app.layout = html.Div([
+    dcc.Store(id="summary-store", data=SUMMARY_LOOKUP),
+    dcc.Store(id="line-athlete-store"),
+    dcc.Store(id="athlete-debounced"),
+
     # Main content container with new layout
     html.Div([
         # Header Section
@@ -338,97 +583,37 @@ app.layout = html.Div([
             html.Div([
                 # Jump Height Left Donut
                 html.Div([
-                    html.H4("Jump Height Left", style={
-                        "textAlign": "center",
-                        "color": COLORS['secondary'],
-                        "marginBottom": "5px",
-                        "fontSize": "16px",
-                        "fontWeight": "bold",
-                        "letterSpacing": "0.3px",
-                        "fontFamily": "Helvetica, Arial, sans-serif"
-                    }),
+                    html.H4("Jump Height Left", style=DONUT_HEADING_STYLE),
                     dcc.Graph(id="jump-left-donut", style={"height": "250px"})
                 ], style={"width": "20%", "display": "inline-block"}),
 
                 # Jump Height Asymmetry
                 html.Div([
-                    html.H4("Jump Height Asymmetry", style={
-                        "textAlign": "center",
-                        "color": COLORS['secondary'],
-                        "marginBottom": "5px",
-                        "fontSize": "16px",
-                        "fontWeight": "bold",
-                        "letterSpacing": "0.3px",
-                        "fontFamily": "Helvetica, Arial, sans-serif"
-                    }),
-                    html.H2(id="jump-asymmetry", style={
-                        "textAlign": "center",
-                        "color": COLORS['secondary'],
-                        "fontSize": "18px",
-                        "fontWeight": "bold",
-                        "fontFamily": "Helvetica, Arial, sans-serif"
-                    })
+                    html.H4("Jump Height Asymmetry", style=DONUT_HEADING_STYLE),
+                    html.H2(id="jump-asymmetry", style=ASYMMETRY_VALUE_STYLE)
                 ], style={"width": "5%", "display": "inline-block", "verticalAlign": "middle"}),
 
                 # Jump Height Right Donut
                 html.Div([
-                    html.H4("Jump Height Right", style={
-                        "textAlign": "center",
-                        "color": COLORS['secondary'],
-                        "marginBottom": "5px",
-                        "fontSize": "16px",
-                        "fontWeight": "bold",
-                        "letterSpacing": "0.3px",
-                        "fontFamily": "Helvetica, Arial, sans-serif"
-                    }),
+                    html.H4("Jump Height Right", style=DONUT_HEADING_STYLE),
                     dcc.Graph(id="jump-right-donut", style={"height": "250px"})
                 ], style={"width": "20%", "display": "inline-block", "marginRight": "5%"}),
 
                 # RSI Left Donut
                 html.Div([
-                    html.H4("RSI Left", style={
-                        "textAlign": "center",
-                        "color": COLORS['secondary'],
-                        "marginBottom": "5px",
-                        "fontSize": "16px",
-                        "fontWeight": "bold",
-                        "letterSpacing": "0.3px",
-                        "fontFamily": "Helvetica, Arial, sans-serif"
-                    }),
+                    html.H4("RSI Left", style=DONUT_HEADING_STYLE),
                     dcc.Graph(id="rsid-left-donut", style={"height": "250px"})
                 ], style={"width": "20%", "display": "inline-block"}),
 
                 # RSI Asymmetry
     html.Div([
-                    html.H4("RSI Asymmetry", style={
-                        "textAlign": "center",
-                        "color": COLORS['secondary'],
-                        "marginBottom": "5px",
-                        "fontSize": "16px",
-                        "fontWeight": "bold",
-                        "letterSpacing": "0.3px",
-                        "fontFamily": "Helvetica, Arial, sans-serif"
-                    }),
-                    html.H2(id="rsid-asymmetry", style={
-                        "textAlign": "center",
-                        "color": COLORS['secondary'],
-                        "fontSize": "18px",
-                        "fontWeight": "bold",
-                        "fontFamily": "Helvetica, Arial, sans-serif"
-                    })
+                    html.H4("RSI Asymmetry", style=DONUT_HEADING_STYLE),
+                    html.H2(id="rsid-asymmetry", style=ASYMMETRY_VALUE_STYLE)
                 ], style={"width": "5%", "display": "inline-block", "verticalAlign": "middle"}),
 
                 # RSI Right Donut
                 html.Div([
-                    html.H4("RSI Right", style={
-                        "textAlign": "center",
-                        "color": COLORS['secondary'],
-                        "marginBottom": "5px",
-                        "fontSize": "16px",
-                        "fontWeight": "bold",
-                        "letterSpacing": "0.3px",
-                        "fontFamily": "Helvetica, Arial, sans-serif"
-                    }),
+                    html.H4("RSI Right", style=DONUT_HEADING_STYLE),
                     dcc.Graph(id="rsid-right-donut", style={"height": "250px"})
                 ], style={"width": "20%", "display": "inline-block"})
             ], style={"width": "100%", "textAlign": "center"})
@@ -446,606 +631,258 @@ app.layout = html.Div([
     "margin": "0 auto"
 })
 
-# Callbacks
-@app.callback(
-    Output("athlete-title", "children"),
-    Output("athlete-info", "children"),
-    Output("jump-left-donut", "figure"),
-    Output("jump-right-donut", "figure"),
-    Output("rsid-left-donut", "figure"),
-    Output("rsid-right-donut", "figure"),
-    Output("jump-asymmetry", "children"),
-    Output("rsid-asymmetry", "children"),
-    Output("extension-line", "figure"),
-    Output("flexion-line", "figure"),
-    Output("calf-line", "figure"),
-    Input("athlete-dropdown", "value"),
-    Input("date-dropdown", "value")
+# Left/right columns plotted on the extension, flexion and calf line figures
+LINE_COLUMNS = (
+    ("knee_extension_left", "knee_extension_right"),
+    ("knee_flexion_left", "knee_flexion_right"),
+    ("calf_strength_left", "calf_strength_right")
 )
-def update_dashboard(selected_athlete, selected_date):
-    if selected_athlete is None or selected_date is None:
-        return "", "", {}, {}, {}, {}, "", "", {}, {}, {}
-        
-    athlete_df = df[df["athlete"] == selected_athlete].sort_values("date")
-    latest = athlete_df[athlete_df["date"] == selected_date].iloc[0]
-    
-    # Calculate age
-    age = (latest["date"] - latest["date_of_birth"]).days / 365.25
-    injury_days = (latest["date"] - latest["injury_date"]).days
-    
-    # Calculate weeks since injury for x-axis
-    weeks_since_injury = (athlete_df["date"] - latest["injury_date"]).dt.days / 7
 
-    # Calculate percentages for each side
-    jump_left_percentage = (latest["sl_jump_height_left"] / 17.0) * 100
-    jump_right_percentage = (latest["sl_jump_height_right"] / 17.0) * 100
-    rsid_left_percentage = (latest["rsid_left"] / 0.52) * 100
-    rsid_right_percentage = (latest["rsid_right"] / 0.52) * 100
+# Strength line figures, cached per athlete as serialized dicts
+@lru_cache(maxsize=128)
+def build_athlete_figures(selected_athlete):
+    """Build the strength line figures for one athlete; they are the same for every test date"""
+    athlete_df = GROUPS[selected_athlete]
+    weeks_since_injury = np.ascontiguousarray(athlete_df["weeks_since_injury"].values, dtype=np.float32)
+    weeks_spec = typed_array(weeks_since_injury)
+
+    return tuple(
+        fill_line_template(template, encode_lines(weeks_since_injury, weeks_spec,
+                                                  athlete_df[left_column].values,
+                                                  athlete_df[right_column].values))
+        for template, (left_column, right_column) in zip(
+            (EXTENSION_TEMPLATE, FLEXION_TEMPLATE, CALF_TEMPLATE), LINE_COLUMNS)
+    )
 
-    # Get common layout
-    common_layout = get_common_layout()
+# Partial updates for line figures already on screen: only the trace data changes between athletes
+@lru_cache(maxsize=128)
+def build_athlete_patches(selected_athlete):
+    """Build Patch objects that replace the x/y data of each strength line figure's traces"""
+    patches = []
+    for figure in build_athlete_figures(selected_athlete):
+        patched = Patch()
+        for i, trace in enumerate(figure["data"]):
+            patched["data"][i]["x"] = trace["x"]
+            patched["data"][i]["y"] = trace["y"]
+        patches.append(patched)
+    return tuple(patches)
+
+# Figure building, cached on (athlete, date) so revisited selections skip the rebuild
+@lru_cache(maxsize=256)
+def build_dashboard(selected_athlete, date_ns):
+    """Build the donut figures for one athlete on one test date (date as int nanoseconds)"""
+    athlete_df = GROUPS[selected_athlete]
+    latest = athlete_df.iloc[DATE_INDEX[(selected_athlete, pd.Timestamp(date_ns))]]
+
+    # Donut measurements, percentages of target and remaining-to-target in one vectorized pass
+    donut_values = latest[DONUT_COLUMNS].to_numpy(dtype=np.float32)
+    jump_left, jump_right, rsid_left, rsid_right = donut_values
+    jump_left_percentage, jump_right_percentage, rsid_left_percentage, rsid_right_percentage = (
+        donut_values / DONUT_TARGETS * 100
+    )
+    jump_left_remaining, jump_right_remaining, rsid_left_remaining, rsid_right_remaining = (
+        np.maximum(0.0, DONUT_TARGETS - donut_values)
+    )
 
     # Donut chart: Single-leg jump height (Left)
-    colors_left = get_color_gradient(jump_left_percentage, 'left')
-    jump_left_fig = go.Figure()
+    colors_left = GRADIENT_COLORS['left']
+    jump_left_fig = {"data": [], "layout": {"template": FIGURE_TEMPLATE}}
     
     # Add glow effect
     add_donut_glow(jump_left_fig, jump_left_percentage, colors_left[0])
     
     # Add main donut
-    jump_left_fig.add_trace(go.Pie(
-        labels=["Achieved", "Remaining"],
-        values=[
-            latest["sl_jump_height_left"],
-            max(0, 17.0 - latest["sl_jump_height_left"])
-        ],
-        hole=0.7,
-        marker=dict(
-            colors=[colors_left[0], COLORS['light_gray']],
-            line=dict(width=0)
-        ),
-        textinfo='none'
-    ))
+    add_donut_arcs(
+        jump_left_fig,
+        jump_left,
+        jump_left_remaining,
+        colors_left[0]
+    )
     
     # Update layout
-    jump_left_fig.update_layout(
-        title={
-            "text": "",
-            "font": {"size": 16, "color": COLORS['secondary']},
-            "y": 0.95,
-            "x": 0.5,
-            "xanchor": "center"
-        },
+    jump_left_fig["layout"].update(
+        title=DONUT_TITLE,
         showlegend=False,
         annotations=[dict(
-            text=f"{jump_left_percentage:.1f}%<br>{latest['sl_jump_height_left']:.1f}cm",
-            font=dict(size=32, color=COLORS['secondary']),
+            text=f"{jump_left_percentage:.1f}%<br>{jump_left:.1f}cm",
+            font=DONUT_ANNOTATION_FONT,
             showarrow=False,
             x=0.5,
             y=0.5
-        )],
-        **common_layout
+        )]
     )
 
     # Donut chart: Single-leg jump height (Right)
-    colors_right = get_color_gradient(jump_right_percentage, 'right')
-    jump_right_fig = go.Figure()
+    colors_right = GRADIENT_COLORS['right']
+    jump_right_fig = {"data": [], "layout": {"template": FIGURE_TEMPLATE}}
     
     # Add glow effect
     add_donut_glow(jump_right_fig, jump_right_percentage, colors_right[0])
     
     # Add main donut
-    jump_right_fig.add_trace(go.Pie(
-        labels=["Achieved", "Remaining"],
-        values=[
-            latest["sl_jump_height_right"],
-            max(0, 17.0 - latest["sl_jump_height_right"])
-        ],
-        hole=0.7,
-        marker=dict(
-            colors=[colors_right[0], COLORS['light_gray']],
-            line=dict(width=0)
-        ),
-        textinfo='none'
-    ))
+    add_donut_arcs(
+        jump_right_fig,
+        jump_right,
+        jump_right_remaining,
+        colors_right[0]
+    )
     
     # Update layout
-    jump_right_fig.update_layout(
-        title={
-            "text": "",
-            "font": {"size": 16, "color": COLORS['secondary']},
-            "y": 0.95,
-            "x": 0.5,
-            "xanchor": "center"
-        },
+    jump_right_fig["layout"].update(
+        title=DONUT_TITLE,
         showlegend=False,
         annotations=[dict(
-            text=f"{jump_right_percentage:.1f}%<br>{latest['sl_jump_height_right']:.1f}cm",
-            font=dict(size=32, color=COLORS['secondary']),
+            text=f"{jump_right_percentage:.1f}%<br>{jump_right:.1f}cm",
+            font=DONUT_ANNOTATION_FONT,
             showarrow=False,
             x=0.5,
             y=0.5
-        )],
-        **common_layout
+        )]
     )
 
     # Donut chart: Reactive Strength Index (Left)
-    colors_left = get_color_gradient(rsid_left_percentage, 'left')
-    rsid_left_fig = go.Figure()
+    colors_left = GRADIENT_COLORS['left']
+    rsid_left_fig = {"data": [], "layout": {"template": FIGURE_TEMPLATE}}
     
     # Add glow effect
     add_donut_glow(rsid_left_fig, rsid_left_percentage, colors_left[0])
     
     # Add main donut
-    rsid_left_fig.add_trace(go.Pie(
-        labels=["Achieved", "Remaining"],
-        values=[
-            latest["rsid_left"],
-            max(0, 0.52 - latest["rsid_left"])
-        ],
-        hole=0.7,
-        marker=dict(
-            colors=[colors_left[0], COLORS['light_gray']],
-            line=dict(width=0)
-        ),
-        textinfo='none'
-    ))
+    add_donut_arcs(
+        rsid_left_fig,
+        rsid_left,
+        rsid_left_remaining,
+        colors_left[0]
+    )
     
     # Update layout
-    rsid_left_fig.update_layout(
-        title={
-            "text": "",
-            "font": {"size": 16, "color": COLORS['secondary']},
-            "y": 0.95,
-            "x": 0.5,
-            "xanchor": "center"
-        },
+    rsid_left_fig["layout"].update(
+        title=DONUT_TITLE,
         showlegend=False,
         annotations=[dict(
-            text=f"{rsid_left_percentage:.1f}%<br>{latest['rsid_left']:.2f}",
-            font=dict(size=32, color=COLORS['secondary']),
+            text=f"{rsid_left_percentage:.1f}%<br>{rsid_left:.2f}",
+            font=DONUT_ANNOTATION_FONT,
             showarrow=False,
             x=0.5,
             y=0.5
-        )],
-        **common_layout
+        )]
     )
 
     # Donut chart: Reactive Strength Index (Right)
-    colors_right = get_color_gradient(rsid_right_percentage, 'right')
-    rsid_right_fig = go.Figure()
+    colors_right = GRADIENT_COLORS['right']
+    rsid_right_fig = {"data": [], "layout": {"template": FIGURE_TEMPLATE}}
     
     # Add glow effect
     add_donut_glow(rsid_right_fig, rsid_right_percentage, colors_right[0])
     
     # Add main donut
-    rsid_right_fig.add_trace(go.Pie(
-        labels=["Achieved", "Remaining"],
-        values=[
-            latest["rsid_right"],
-            max(0, 0.52 - latest["rsid_right"])
-        ],
-        hole=0.7,
-        marker=dict(
-            colors=[colors_right[0], COLORS['light_gray']],
-            line=dict(width=0)
-        ),
-        textinfo='none'
-    ))
+    add_donut_arcs(
+        rsid_right_fig,
+        rsid_right,
+        rsid_right_remaining,
+        colors_right[0]
+    )
     
     # Update layout
-    rsid_right_fig.update_layout(
-        title={
-            "text": "",
-            "font": {"size": 16, "color": COLORS['secondary']},
-            "y": 0.95,
-            "x": 0.5,
-            "xanchor": "center"
-        },
+    rsid_right_fig["layout"].update(
+        title=DONUT_TITLE,
         showlegend=False,
         annotations=[dict(
-            text=f"{rsid_right_percentage:.1f}%<br>{latest['rsid_right']:.2f}",
-            font=dict(size=32, color=COLORS['secondary']),
+            text=f"{rsid_right_percentage:.1f}%<br>{rsid_right:.2f}",
+            font=DONUT_ANNOTATION_FONT,
             showarrow=False,
             x=0.5,
             y=0.5
-        )],
-        **common_layout
+        )]
     )
 
-    # Line graph: Knee Extension Strength
-    extension_fig = go.Figure()
-    
-    # Add knee extension traces with glow effects
-    add_glow_effect(extension_fig, 
-                   weeks_since_injury,
-                   athlete_df["knee_extension_left"],
-                   COLORS['left'],
-                   opacity=0.2)
-    add_glow_effect(extension_fig,
-                   weeks_since_injury,
-                   athlete_df["knee_extension_right"],
-                   COLORS['right'],
-                   opacity=0.2)
-    
-    # Add knee extension traces
-    extension_fig.add_trace(go.Scatter(
-        x=weeks_since_injury,
-        y=athlete_df["knee_extension_left"],
-        mode="lines+markers",
-        name="Left",
-        legendgroup="Left",
-        line=dict(
-            color=COLORS['left'],
-            width=5,
-            shape='spline'
-        ),
-        marker=dict(
-            size=12,
-            color=COLORS['left'],
-            line=dict(width=3, color=COLORS['white'])
-        ),
-        hovertemplate='%{y:.2f} N.m.kg⁻¹<extra>Left</extra>'
-    ))
-    extension_fig.add_trace(go.Scatter(
-        x=weeks_since_injury,
-        y=athlete_df["knee_extension_right"],
-        mode="lines+markers",
-        name="Right",
-        legendgroup="Right",
-        line=dict(
-            color=COLORS['right'],
-            width=5,
-            shape='spline'
-        ),
-        marker=dict(
-            size=12,
-            color=COLORS['right'],
-            line=dict(width=3, color=COLORS['white'])
-        ),
-        hovertemplate='%{y:.2f} N.m.kg⁻¹<extra>Right</extra>'
-    ))
-    
-    # Add target line
-    extension_fig.add_hline(
-        y=3.3,
-        line_dash="dash",
-        line_color=COLORS['secondary'],
-        line_width=2,
-        annotation_text="Target: 3.3 N.m.kg⁻¹",
-        annotation_position="right",
-        annotation_font_size=12,
-        annotation_font_color=COLORS['secondary']
-    )
-    
-    # Add 70% threshold line
-    extension_fig.add_hline(
-        y=2.31,  # 70% of 3.3
-        line_dash="dot",
-        line_color=COLORS['secondary'],
-        line_width=1,
-        annotation_text="70% Target: 2.31 N.m.kg⁻¹",
-        annotation_position="right",
-        annotation_font_size=10,
-        annotation_font_color=COLORS['secondary']
-    )
+    return jump_left_fig, jump_right_fig, rsid_left_fig, rsid_right_fig
 
-    # Update layout
-    extension_fig.update_layout(
-        title={
-            "text": "Knee Extension",
-            "font": {"size": 24, "color": COLORS['secondary']},
-            "y": 0.95,
-            "x": 0.5,
-            "xanchor": "center"
-        },
-        yaxis_title={
-            "text": "Strength (N.m.kg⁻¹)",
-            "font": {"size": 14, "color": COLORS['secondary']}
-        },
-        xaxis_title={
-            "text": "Weeks Post-Injury",
-            "font": {"size": 14, "color": COLORS['secondary']}
-        },
-        showlegend=True,
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01,
-            bgcolor=COLORS['white'],
-            bordercolor="rgba(0,0,0,0)",
-            font=dict(size=12, color=COLORS['secondary'])
-        ),
-        **common_layout
-    )
+# Callbacks
+# Text outputs are looked up in the browser; only the figures need the server
+app.clientside_callback(
+    """
+    function(athlete, date, summaries) {
+        const summary = (athlete && date && summaries) ? summaries[athlete + "|" + String(date).slice(0, 10)] : null;
+        return summary || ["", "", "", ""];
+    }
+    """,
+    Output("athlete-title", "children"),
+    Output("athlete-info", "children"),
+    Output("jump-asymmetry", "children"),
+    Output("rsid-asymmetry", "children"),
+    Input("athlete-dropdown", "value"),
+    Input("date-dropdown", "value"),
+    State("summary-store", "data")
+)
 
-    # Line graph: Knee Flexion Strength
-    flexion_fig = go.Figure()
-    
-    # Add knee flexion traces with glow effects
-    add_glow_effect(flexion_fig,
-                   weeks_since_injury,
-                   athlete_df["knee_flexion_left"],
-                   COLORS['left'],
-                   opacity=0.2)
-    add_glow_effect(flexion_fig,
-                   weeks_since_injury,
-                   athlete_df["knee_flexion_right"],
-                   COLORS['right'],
-                   opacity=0.2)
-    
-    # Add knee flexion traces
-    flexion_fig.add_trace(go.Scatter(
-        x=weeks_since_injury,
-        y=athlete_df["knee_flexion_left"],
-        mode="lines+markers",
-        name="Left",
-        legendgroup="Left",
-        line=dict(
-            color=COLORS['left'],
-            width=5,
-            shape='spline'
-        ),
-        marker=dict(
-            size=12,
-            color=COLORS['left'],
-            line=dict(width=3, color=COLORS['white'])
-        ),
-        hovertemplate='%{y:.2f} N.m.kg⁻¹<extra>Left</extra>'
-    ))
-    flexion_fig.add_trace(go.Scatter(
-        x=weeks_since_injury,
-        y=athlete_df["knee_flexion_right"],
-        mode="lines+markers",
-        name="Right",
-        legendgroup="Right",
-        line=dict(
-            color=COLORS['right'],
-            width=5,
-            shape='spline'
-        ),
-        marker=dict(
-            size=12,
-            color=COLORS['right'],
-            line=dict(width=3, color=COLORS['white'])
-        ),
-        hovertemplate='%{y:.2f} N.m.kg⁻¹<extra>Right</extra>'
-    ))
-    
-    # Add target line
-    flexion_fig.add_hline(
-        y=2.0,
-        line_dash="dash",
-        line_color=COLORS['secondary'],
-        line_width=2,
-        annotation_text="Target: 2.0 N.m.kg⁻¹",
-        annotation_position="right",
-        annotation_font_size=12,
-        annotation_font_color=COLORS['secondary']
-    )
-    
-    # Add 70% threshold line
-    flexion_fig.add_hline(
-        y=1.4,  # 70% of 2.0
-        line_dash="dot",
-        line_color=COLORS['secondary'],
-        line_width=1,
-        annotation_text="70% Target: 1.4 N.m.kg⁻¹",
-        annotation_position="right",
-        annotation_font_size=10,
-        annotation_font_color=COLORS['secondary']
-    )
+# Coalesce rapid athlete changes so only the last selection within 150 ms reaches the server;
+# a superseded selection resolves with no_update rather than being left pending
+app.clientside_callback(
+    """
+    function(athlete) {
+        clearTimeout(window.athleteDebounceTimer);
+        if (window.athleteDebounceResolve) {
+            window.athleteDebounceResolve(window.dash_clientside.no_update);
+        }
+        return new Promise(function(resolve) {
+            window.athleteDebounceResolve = resolve;
+            window.athleteDebounceTimer = setTimeout(function() {
+                window.athleteDebounceResolve = null;
+                resolve(athlete);
+            }, 150);
+        });
+    }
+    """,
+    Output("athlete-debounced", "data"),
+    Input("athlete-dropdown", "value")
+)
 
-    # Update layout
-    flexion_fig.update_layout(
-        title={
-            "text": "Knee Flexion",
-            "font": {"size": 24, "color": COLORS['secondary']},
-            "y": 0.95,
-            "x": 0.5,
-            "xanchor": "center"
-        },
-        yaxis_title={
-            "text": "Strength (N.m.kg⁻¹)",
-            "font": {"size": 14, "color": COLORS['secondary']}
-        },
-        xaxis_title={
-            "text": "Weeks Post-Injury",
-            "font": {"size": 14, "color": COLORS['secondary']}
-        },
-        showlegend=True,
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01,
-            bgcolor=COLORS['white'],
-            bordercolor="rgba(0,0,0,0)",
-            font=dict(size=12, color=COLORS['secondary'])
-        ),
-        **common_layout
-    )
+@app.callback(
+    Output("jump-left-donut", "figure"),
+    Output("jump-right-donut", "figure"),
+    Output("rsid-left-donut", "figure"),
+    Output("rsid-right-donut", "figure"),
+    Output("extension-line", "figure"),
+    Output("flexion-line", "figure"),
+    Output("calf-line", "figure"),
+    Output("line-athlete-store", "data"),
+    Input("athlete-debounced", "data"),
+    Input("date-dropdown", "value"),
+    State("line-athlete-store", "data")
+)
+def update_dashboard(selected_athlete, selected_date, rendered_athlete):
+    if selected_athlete is None or selected_date is None:
+        return {}, {}, {}, {}, {}, {}, {}, None
 
-    # Line graph: Calf Strength
-    calf_fig = go.Figure()
-    
-    # Add calf strength traces with glow effects
-    add_glow_effect(calf_fig,
-                   weeks_since_injury,
-                   athlete_df["calf_strength_left"],
-                   COLORS['left'],
-                   opacity=0.2)
-    add_glow_effect(calf_fig,
-                   weeks_since_injury,
-                   athlete_df["calf_strength_right"],
-                   COLORS['right'],
-                   opacity=0.2)
-    
-    # Add calf strength traces
-    calf_fig.add_trace(go.Scatter(
-        x=weeks_since_injury,
-        y=athlete_df["calf_strength_left"],
-        mode="lines+markers",
-        name="Left",
-        legendgroup="Left",
-        line=dict(
-            color=COLORS['left'],
-            width=5,
-            shape='spline'
-        ),
-        marker=dict(
-            size=12,
-            color=COLORS['left'],
-            line=dict(width=3, color=COLORS['white'])
-        ),
-        hovertemplate='%{y:.1f}%% BW<extra>Left</extra>'
-    ))
-    calf_fig.add_trace(go.Scatter(
-        x=weeks_since_injury,
-        y=athlete_df["calf_strength_right"],
-        mode="lines+markers",
-        name="Right",
-        legendgroup="Right",
-        line=dict(
-            color=COLORS['right'],
-            width=5,
-            shape='spline'
-        ),
-        marker=dict(
-            size=12,
-            color=COLORS['right'],
-            line=dict(width=3, color=COLORS['white'])
-        ),
-        hovertemplate='%{y:.1f}%% BW<extra>Right</extra>'
-    ))
-    
-    # Add target line (200% bodyweight)
-    calf_fig.add_hline(
-        y=200,
-        line_dash="dash",
-        line_color=COLORS['secondary'],
-        line_width=2,
-        annotation_text="Target: 200% BW",
-        annotation_position="right",
-        annotation_font_size=12,
-        annotation_font_color=COLORS['secondary']
-    )
-    
-    # Add 70% threshold line (140% bodyweight)
-    calf_fig.add_hline(
-        y=140,  # 70% of 200
-        line_dash="dot",
-        line_color=COLORS['secondary'],
-        line_width=1,
-        annotation_text="70% Target: 140% BW",
-        annotation_position="right",
-        annotation_font_size=10,
-        annotation_font_color=COLORS['secondary']
-    )
-    
-    # Update layout
-    calf_fig.update_layout(
-        title={
-            "text": "Seated Plantarflexion",
-            "font": {"size": 24, "color": COLORS['secondary']},
-            "y": 0.95,
-            "x": 0.5,
-            "xanchor": "center"
-        },
-        yaxis_title={
-            "text": "Strength (% Bodyweight)",
-            "font": {"size": 14, "color": COLORS['secondary']}
-        },
-        xaxis_title={
-            "text": "Weeks Post-Injury",
-            "font": {"size": 14, "color": COLORS['secondary']}
-        },
-        showlegend=True,
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01,
-            bgcolor=COLORS['white'],
-            bordercolor="rgba(0,0,0,0)",
-            font=dict(size=12, color=COLORS['secondary'])
-        ),
-        **common_layout
-    )
+    donut_figs = build_dashboard(selected_athlete, pd.Timestamp(selected_date).value)
 
-    # Update the layout for all line graphs to include gradient fill
-    for fig in [extension_fig, flexion_fig, calf_fig]:
-        fig.update_layout(
-            plot_bgcolor=COLORS['white'],
-            paper_bgcolor=COLORS['white'],
-            xaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(1, 173, 216, 0.1)",
-                zeroline=False
-            ),
-            yaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(1, 173, 216, 0.1)",
-                zeroline=False
-            )
-        )
+    # Line figures only depend on the athlete, so a date change leaves them (and the store) as they are
+    if rendered_athlete == selected_athlete:
+        return donut_figs + (dash.no_update,) * 4
 
-    # Update layout for all graphs
-    for fig in [extension_fig, flexion_fig, calf_fig]:
-        fig.update_layout(
-            title={
-                "text": fig.layout.title.text,
-                "font": {
-                    "size": 20,
-                    "color": COLORS['secondary'],
-                    "family": "Helvetica, Arial, sans-serif",
-                    "weight": "bold"
-                },
-                "y": 0.95,
-                "x": 0.5,
-                "xanchor": "center"
-            },
-            yaxis_title={
-                "text": fig.layout.yaxis.title.text,
-                "font": {
-                    "size": 14,
-                    "color": COLORS['secondary'],
-                    "family": "Helvetica, Arial, sans-serif"
-                }
-            },
-            xaxis_title={
-                "text": fig.layout.xaxis.title.text,
-                "font": {
-                    "size": 14,
-                    "color": COLORS['secondary'],
-                    "family": "Helvetica, Arial, sans-serif"
-                }
-            },
-            showlegend=True,
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="left",
-                x=0.01,
-                bgcolor=COLORS['white'],
-                bordercolor="rgba(0,0,0,0)",
-                font=dict(
-                    size=12,
-                    color=COLORS['secondary'],
-                    family="Helvetica, Arial, sans-serif"
-                )
-            ),
-            **common_layout
-        )
+    # Switching athletes with the line figures already drawn only swaps their trace data
+    if rendered_athlete is not None and dash.callback_context.triggered_id == "athlete-debounced":
+        line_figs = build_athlete_patches(selected_athlete)
+    else:
+        line_figs = build_athlete_figures(selected_athlete)
+
+    return donut_figs + line_figs + (selected_athlete,)
+
+# Startup warm-up
+def preload_figures():
+    """Build and serialize the default selection's figures so the first page load hits warm caches"""
+    if not athletes or not dates:
+        return
+    athlete, date = athletes[0], pd.Timestamp(dates[-1])
+    if (athlete, date) not in DATE_INDEX:
+        return
+    build_dashboard(athlete, date.value)
+    pio.json.to_json_plotly(build_athlete_figures(athlete))
 
-    return (selected_athlete,
-            f"Age: {age:.1f} years | Injury Date: {latest['injury_date'].strftime('%d/%m/%Y')} | Weeks Post-Injury: {injury_days/7:.1f}",
-            jump_left_fig, jump_right_fig, rsid_left_fig, rsid_right_fig,
-            f"{latest['jump_height_asymmetry']:.1f}%",
-            f"{latest['rsid_asymmetry']:.1f}%",
-            extension_fig, flexion_fig, calf_fig)
+preload_figures()
 
 # Run app
 if __name__ == "__main__":
-    app.run(debug=True)
+    # Debug mode (reloader, dev tools) is opt-in via DASH_DEBUG=1; Dash reads HOST and PORT itself
+    app.run(debug=os.environ.get("DASH_DEBUG", "0") == "1")
@@ -1,12 +1,13 @@
-import dash
 from dash import html, dcc
 import plotly.graph_objects as go
-from dash.dependencies import Input, Output, State
-import pandas as pd
 import numpy as np
-from datetime import datetime
-import os
-from NavigationDashboard import create_nav_circle
+import plotly.io as pio
+import zlib
+from functools import lru_cache
+from datetime import date
+from bisect import bisect_right
+from heapq import merge
+from NavigationDashboard import create_nav_circle, create_header, create_title, create_home_button, NAV_PAGES, DATES
 
 # Define Healthia Performance colors
 COLORS = {
@@ -16,8 +17,12 @@ COLORS = {
     'text': '#455A64',         # Dark slate
 }
 
-# Define dates for all graphs
-DATES = pd.date_range(start='2023-01-01', end='2023-12-31', freq='ME')
+# Define dates for all graphs: the 2023 month ends, shared with the navigation dropdowns.
+# DATES_NP feeds the line graphs directly; DATES holds the same days as datetimes for formatting
+DATES_NP = np.array(DATES, dtype='datetime64[D]')
+
+# Most recent test date (DATES is sorted, so the last entry is the latest)
+LAST_TEST_DATE = DATES[-1].strftime('%d/%m/%Y')
 
 # Sample data for power metrics
 power_data = {
@@ -58,306 +63,118 @@ strength_data = {
     }
 }
 
-def create_strength_chart(title):
-    data = strength_data[title]
-    left_raw = data["left"]
-    right_raw = data["right"]
-    target = data["target"]
-    unit = data["unit"]
-    test_date = data["test_date"]
-    
-    # Calculate percentages
-    left_percent = min(100, (left_raw / target) * 100)
-    right_percent = min(100, (right_raw / target) * 100)
-    
-    # Calculate asymmetry
-    asymmetry = abs(left_raw - right_raw) / max(left_raw, right_raw) * 100
-    asymmetry_color = (
-        '#4CAF50' if asymmetry < 10 else  # Green for <10%
-        '#FFC107' if asymmetry < 20 else  # Amber for 10-20%
-        '#F44336'  # Red for >20%
-    )
-    
-    # Create left donut
-    fig_left = go.Figure()
-    fig_left.add_trace(go.Pie(
-        values=[left_percent, 100-left_percent],
-        hole=0.7,
-        marker_colors=[COLORS['secondary'], 'rgba(0, 188, 212, 0.2)'],
-        showlegend=False,
-        textinfo='none',
-        hoverinfo='none'
-    ))
-    fig_left.update_layout(
-        title="Left",
-        showlegend=False,
-        margin=dict(t=30, b=30, l=30, r=30),
-        height=250,
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Helvetica, Arial, sans-serif"),
-        autosize=True,
-        dragmode='pan'
-    )
-    # Add percentage
-    fig_left.add_annotation(
-        text=f"{left_percent:.0f}%",
-        x=0.5,
-        y=0.65,
-        font=dict(size=36, color=COLORS['secondary']),
-        showarrow=False
-    )
-    # Add raw value
-    fig_left.add_annotation(
-        text=f"{left_raw:.1f} {unit}",
-        x=0.5,
-        y=0.35,
-        font=dict(size=16, color=COLORS['secondary']),
-        showarrow=False
-    )
-    
-    # Create right donut
-    fig_right = go.Figure()
-    fig_right.add_trace(go.Pie(
-        values=[right_percent, 100-right_percent],
-        hole=0.7,
-        marker_colors=[COLORS['primary'], 'rgba(69, 90, 100, 0.2)'],
-        showlegend=False,
-        textinfo='none',
-        hoverinfo='none'
-    ))
-    fig_right.update_layout(
-        title="Right",
-        showlegend=False,
-        margin=dict(t=30, b=30, l=30, r=30),
-        height=250,
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Helvetica, Arial, sans-serif"),
-        autosize=True,
-        dragmode='pan'
-    )
-    # Add percentage
-    fig_right.add_annotation(
-        text=f"{right_percent:.0f}%",
-        x=0.5,
-        y=0.65,
-        font=dict(size=36, color=COLORS['primary']),
-        showarrow=False
-    )
-    # Add raw value
-    fig_right.add_annotation(
-        text=f"{right_raw:.1f} {unit}",
-        x=0.5,
-        y=0.35,
-        font=dict(size=16, color=COLORS['primary']),
-        showarrow=False
-    )
-    
-    return html.Div([
-        html.H3(title, style={
-            'textAlign': 'center',
-            'color': COLORS['text'],
-            'marginBottom': '20px'
-        }),
-        html.Div([
-            html.Div([
-                dcc.Graph(
-                    figure=fig_left,
-                    style={'height': '250px', 'marginBottom': '5px'},
-                    config={'displayModeBar': False}
-                ),
-                html.Div([
-                    html.Span("Asymmetry: ", style={
-                        'color': COLORS['text'],
-                        'fontSize': '14px',
-                        'fontWeight': 'normal'
-                    }),
-                    html.Span(f"{asymmetry:.1f}%", style={
-                        'color': asymmetry_color,
-                        'fontSize': '16px',
-                        'fontWeight': 'bold',
-                        'marginLeft': '2px'
-                    })
-                ], style={
-                    'textAlign': 'center',
-                    'marginTop': '5px',
-                    'marginBottom': '10px',
-                    'backgroundColor': 'rgba(255, 255, 255, 0.9)',
-                    'padding': '5px',
-                    'borderRadius': '4px',
-                    'boxShadow': '0 1px 3px rgba(0,0,0,0.1)'
-                })
-            ], style={'width': '50%'}),
-            html.Div([
-                dcc.Graph(
-                    figure=fig_right,
-                    style={'height': '250px', 'marginBottom': '15px'},
-                    config={'displayModeBar': False}
-                )
-            ], style={'width': '50%'})
-        ], style={
-            'display': 'flex',
-            'justifyContent': 'center',
-            'alignItems': 'flex-start'
-        }),
-        html.Div(f"Last tested: {test_date}", style={
-            'textAlign': 'center',
-            'color': COLORS['text'],
-            'fontSize': '14px',
-            'marginBottom': '20px',
-            'fontFamily': 'Helvetica, Arial, sans-serif',
-            'fontWeight': 'normal',
-            'opacity': '0.8'
-        })
-    ])
+# Styles shared by every metric card, built once at import
+LAST_TESTED_STYLE = {
+    'textAlign': 'center',
+    'color': COLORS['text'],
+    'fontSize': '14px',
+    'marginBottom': '20px',
+    'fontFamily': 'Helvetica, Arial, sans-serif',
+    'fontWeight': 'normal',
+    'opacity': '0.8'
+}
+ASYMMETRY_LABEL_STYLE = {
+    'color': COLORS['text'],
+    'fontSize': '14px',
+    'fontWeight': 'normal'
+}
+ASYMMETRY_VALUE_STYLE = {
+    'fontSize': '16px',
+    'fontWeight': 'bold',
+    'marginLeft': '2px'
+}
+ASYMMETRY_BOX_STYLE = {
+    'textAlign': 'center',
+    'marginTop': '5px',
+    'marginBottom': '10px',
+    'backgroundColor': 'rgba(255, 255, 255, 0.9)',
+    'padding': '5px',
+    'borderRadius': '4px',
+    'boxShadow': '0 1px 3px rgba(0,0,0,0.1)'
+}
+DONUT_TITLE_STYLE = {
+    'textAlign': 'center',
+    'color': COLORS['text'],
+    'marginBottom': '20px'
+}
+DONUT_ROW_STYLE = {
+    'display': 'flex',
+    'justifyContent': 'center',
+    'alignItems': 'flex-start'
+}
+DONUT_COLUMN_STYLE = {'width': '50%'}
+LEFT_DONUT_GRAPH_STYLE = {'height': '250px', 'marginBottom': '5px'}
+RIGHT_DONUT_GRAPH_STYLE = {'height': '250px', 'marginBottom': '15px'}
+LINE_GRAPH_STYLE = {'height': '400px', 'marginBottom': '10px'}
 
-def create_power_chart(title):
-    data = power_data[title]
-    left_raw = data["left"]
-    right_raw = data["right"]
-    target = data["target"]
-    unit = data["unit"]
-    
-    # Calculate percentages
-    left_percent = min(100, (left_raw / target) * 100)
-    right_percent = min(100, (right_raw / target) * 100)
-    
-    # Calculate asymmetry
-    asymmetry = abs(left_raw - right_raw) / max(left_raw, right_raw) * 100
-    asymmetry_color = (
-        '#4CAF50' if asymmetry < 10 else  # Green for <10%
-        '#FFC107' if asymmetry < 20 else  # Amber for 10-20%
-        '#F44336'  # Red for >20%
-    )
-    
-    # Create left donut
-    fig_left = go.Figure()
-    fig_left.add_trace(go.Pie(
-        values=[left_percent, 100-left_percent],
-        hole=0.7,
-        marker_colors=[COLORS['secondary'], 'rgba(0, 188, 212, 0.2)'],
-        showlegend=False,
-        textinfo='none',
-        hoverinfo='none'
-    ))
-    fig_left.update_layout(
-        title="Left",
-        showlegend=False,
-        margin=dict(t=30, b=30, l=30, r=30),
-        height=250,
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Helvetica, Arial, sans-serif"),
-        autosize=True,
-        dragmode='pan'
-    )
-    # Add percentage
-    fig_left.add_annotation(
-        text=f"{left_percent:.0f}%",
-        x=0.5,
-        y=0.65,
-        font=dict(size=36, color=COLORS['secondary']),
-        showarrow=False
-    )
-    # Add raw value
-    fig_left.add_annotation(
-        text=f"{left_raw:.1f} {unit}",
-        x=0.5,
-        y=0.35,
-        font=dict(size=16, color=COLORS['secondary']),
-        showarrow=False
-    )
-    
-    # Create right donut
-    fig_right = go.Figure()
-    fig_right.add_trace(go.Pie(
-        values=[right_percent, 100-right_percent],
-        hole=0.7,
-        marker_colors=[COLORS['primary'], 'rgba(69, 90, 100, 0.2)'],
-        showlegend=False,
-        textinfo='none',
-        hoverinfo='none'
-    ))
-    fig_right.update_layout(
-        title="Right",
-        showlegend=False,
-        margin=dict(t=30, b=30, l=30, r=30),
-        height=250,
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Helvetica, Arial, sans-serif"),
-        autosize=True,
-        dragmode='pan'
-    )
-    # Add percentage
-    fig_right.add_annotation(
-        text=f"{right_percent:.0f}%",
-        x=0.5,
-        y=0.65,
-        font=dict(size=36, color=COLORS['primary']),
-        showarrow=False
-    )
-    # Add raw value
-    fig_right.add_annotation(
-        text=f"{right_raw:.1f} {unit}",
-        x=0.5,
-        y=0.35,
-        font=dict(size=16, color=COLORS['primary']),
-        showarrow=False
-    )
-    
-    return html.Div([
-        html.H3(title, style={
-            'textAlign': 'center',
-            'color': COLORS['text'],
-            'marginBottom': '20px'
-        }),
-        html.Div([
-            html.Div([
-                dcc.Graph(
-                    figure=fig_left,
-                    style={'height': '250px', 'marginBottom': '5px'},
-                    config={'displayModeBar': False}
-                ),
-                html.Div([
-                    html.Span("Asymmetry: ", style={
-                        'color': COLORS['text'],
-                        'fontSize': '14px',
-                        'fontWeight': 'normal'
-                    }),
-                    html.Span(f"{asymmetry:.1f}%", style={
-                        'color': asymmetry_color,
-                        'fontSize': '16px',
-                        'fontWeight': 'bold',
-                        'marginLeft': '2px'
-                    })
-                ], style={
-                    'textAlign': 'center',
-                    'marginTop': '5px',
-                    'marginBottom': '10px',
-                    'backgroundColor': 'rgba(255, 255, 255, 0.9)',
-                    'padding': '5px',
-                    'borderRadius': '4px',
-                    'boxShadow': '0 1px 3px rgba(0,0,0,0.1)'
-                })
-            ], style={'width': '50%'}),
-            html.Div([
-                dcc.Graph(
-                    figure=fig_right,
-                    style={'height': '250px', 'marginBottom': '15px'},
-                    config={'displayModeBar': False}
-                )
-            ], style={'width': '50%'})
-        ], style={
-            'display': 'flex',
-            'justifyContent': 'center',
-            'alignItems': 'flex-start'
-        })
-    ])
+# dcc.Graph configs: donuts are static, line graphs resize with their card
+DONUT_GRAPH_CONFIG = {'displayModeBar': False}
+LINE_GRAPH_CONFIG = {'responsive': True, 'displayModeBar': False}
+
+# Asymmetry colour bands: green below 10%, amber from 10% to below 20%, red from 20%
+ASYMMETRY_BREAKS = (10.0, 20.0)
+ASYMMETRY_COLORS = ('#4CAF50', '#FFC107', '#F44336')
+
+# Default Plotly template, embedded in figures written as plain dicts so they match go.Figure output,
+# and the font every figure uses
+FIGURE_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+FIGURE_FONT = dict(family="Helvetica, Arial, sans-serif")
 
-def create_reactive_chart(title):
-    data = reactive_data[title]
+# Layout shared by every left/right donut
+DONUT_MARGIN = dict(t=30, b=30, l=30, r=30)
+DONUT_LAYOUT = {
+    "showlegend": False,
+    "margin": DONUT_MARGIN,
+    "height": 250,
+    "plot_bgcolor": 'white',
+    "paper_bgcolor": 'white',
+    "font": FIGURE_FONT,
+    "autosize": True,
+    "dragmode": 'pan'
+}
+
+def percent_annotation(percent, color):
+    """Large centred percent-of-target label for a donut"""
+    return dict(text=f"{percent:.0f}%", x=0.5, y=0.65, font=dict(size=36, color=color), showarrow=False)
+
+@lru_cache(maxsize=32)
+def last_tested_text(test_date):
+    """'Last tested' footer text for a test date"""
+    return f"Last tested: {test_date}"
+
+def create_last_tested(test_date):
+    """'Last tested' footer for a metric card; a new component per call, since components are mutable"""
+    return html.Div(last_tested_text(test_date), style=LAST_TESTED_STYLE)
+
+@lru_cache(maxsize=64)
+def create_donut(side, percent, raw, unit, precision, color, track_color):
+    """Single donut figure dict showing percent of target, with the raw value underneath"""
+    # Written as a plain figure dict: a fixed two-slice pie needs none of go.Pie's validation
+    return {
+        "data": [{
+            "type": "pie",
+            "values": [percent, 100-percent],
+            "hole": 0.7,
+            "marker": {"colors": [color, track_color]},
+            "showlegend": False,
+            "textinfo": 'none',
+            "hoverinfo": 'none'
+        }],
+        "layout": {
+            **DONUT_LAYOUT,
+            "title": {"text": side},
+            "annotations": [
+                # Percentage
+                percent_annotation(percent, color),
+                # Raw value
+                dict(text=f"{raw:.{precision}f} {unit}", x=0.5, y=0.35, font=dict(size=16, color=color), showarrow=False)
+            ],
+            "template": FIGURE_TEMPLATE
+        }
+    }
+
+def create_donut_pair(title, data, precision, test_date=None):
+    """Left/right donuts with asymmetry for one metric, plus an optional last-tested footer"""
     left_raw = data["left"]
     right_raw = data["right"]
     target = data["target"]
@@ -369,192 +186,109 @@ def create_reactive_chart(title):
     
     # Calculate asymmetry
     asymmetry = abs(left_raw - right_raw) / max(left_raw, right_raw) * 100
-    asymmetry_color = (
-        '#4CAF50' if asymmetry < 10 else  # Green for <10%
-        '#FFC107' if asymmetry < 20 else  # Amber for 10-20%
-        '#F44336'  # Red for >20%
-    )
+    asymmetry_color = ASYMMETRY_COLORS[bisect_right(ASYMMETRY_BREAKS, asymmetry)]
     
-    # Create left donut
-    fig_left = go.Figure()
-    fig_left.add_trace(go.Pie(
-        values=[left_percent, 100-left_percent],
-        hole=0.7,
-        marker_colors=[COLORS['secondary'], 'rgba(0, 188, 212, 0.2)'],
-        showlegend=False,
-        textinfo='none',
-        hoverinfo='none'
-    ))
-    fig_left.update_layout(
-        title="Left",
-        showlegend=False,
-        margin=dict(t=30, b=30, l=30, r=30),
-        height=250,
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Helvetica, Arial, sans-serif"),
-        autosize=True,
-        dragmode='pan'
-    )
-    # Add percentage
-    fig_left.add_annotation(
-        text=f"{left_percent:.0f}%",
-        x=0.5,
-        y=0.65,
-        font=dict(size=36, color=COLORS['secondary']),
-        showarrow=False
-    )
-    # Add raw value
-    fig_left.add_annotation(
-        text=f"{left_raw:.2f} {unit}",
-        x=0.5,
-        y=0.35,
-        font=dict(size=16, color=COLORS['secondary']),
-        showarrow=False
-    )
+    fig_left = create_donut("Left", left_percent, left_raw, unit, precision,
+                            COLORS['secondary'], 'rgba(0, 188, 212, 0.2)')
+    fig_right = create_donut("Right", right_percent, right_raw, unit, precision,
+                             COLORS['primary'], 'rgba(69, 90, 100, 0.2)')
     
-    # Create right donut
-    fig_right = go.Figure()
-    fig_right.add_trace(go.Pie(
-        values=[right_percent, 100-right_percent],
-        hole=0.7,
-        marker_colors=[COLORS['primary'], 'rgba(69, 90, 100, 0.2)'],
-        showlegend=False,
-        textinfo='none',
-        hoverinfo='none'
-    ))
-    fig_right.update_layout(
-        title="Right",
-        showlegend=False,
-        margin=dict(t=30, b=30, l=30, r=30),
-        height=250,
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Helvetica, Arial, sans-serif"),
-        autosize=True,
-        dragmode='pan'
-    )
-    # Add percentage
-    fig_right.add_annotation(
-        text=f"{right_percent:.0f}%",
-        x=0.5,
-        y=0.65,
-        font=dict(size=36, color=COLORS['primary']),
-        showarrow=False
-    )
-    # Add raw value
-    fig_right.add_annotation(
-        text=f"{right_raw:.2f} {unit}",
-        x=0.5,
-        y=0.35,
-        font=dict(size=16, color=COLORS['primary']),
-        showarrow=False
-    )
-    
-    return html.Div([
-        html.H3(title, style={
-            'textAlign': 'center',
-            'color': COLORS['text'],
-            'marginBottom': '20px'
-        }),
+    children = [
+        html.H3(title, style=DONUT_TITLE_STYLE),
         html.Div([
             html.Div([
                 dcc.Graph(
                     figure=fig_left,
-                    style={'height': '250px', 'marginBottom': '5px'},
-                    config={'displayModeBar': False}
+                    style=LEFT_DONUT_GRAPH_STYLE,
+                    config=DONUT_GRAPH_CONFIG
                 ),
                 html.Div([
-                    html.Span("Asymmetry: ", style={
-                        'color': COLORS['text'],
-                        'fontSize': '14px',
-                        'fontWeight': 'normal'
-                    }),
-                    html.Span(f"{asymmetry:.1f}%", style={
-                        'color': asymmetry_color,
-                        'fontSize': '16px',
-                        'fontWeight': 'bold',
-                        'marginLeft': '2px'
-                    })
-                ], style={
-                    'textAlign': 'center',
-                    'marginTop': '5px',
-                    'marginBottom': '10px',
-                    'backgroundColor': 'rgba(255, 255, 255, 0.9)',
-                    'padding': '5px',
-                    'borderRadius': '4px',
-                    'boxShadow': '0 1px 3px rgba(0,0,0,0.1)'
-                })
-            ], style={'width': '50%'}),
+                    html.Span("Asymmetry: ", style=ASYMMETRY_LABEL_STYLE),
+                    html.Span(f"{asymmetry:.1f}%", style={'color': asymmetry_color, **ASYMMETRY_VALUE_STYLE})
+                ], style=ASYMMETRY_BOX_STYLE)
+            ], style=DONUT_COLUMN_STYLE),
             html.Div([
                 dcc.Graph(
                     figure=fig_right,
-                    style={'height': '250px', 'marginBottom': '15px'},
-                    config={'displayModeBar': False}
+                    style=RIGHT_DONUT_GRAPH_STYLE,
+                    config=DONUT_GRAPH_CONFIG
                 )
-            ], style={'width': '50%'})
-        ], style={
-            'display': 'flex',
-            'justifyContent': 'center',
-            'alignItems': 'flex-start'
-        })
-    ])
+            ], style=DONUT_COLUMN_STYLE)
+        ], style=DONUT_ROW_STYLE)
+    ]
+    if test_date is not None:
+        children.append(create_last_tested(test_date))
+    return html.Div(children)
 
-def create_line_graph(title, yaxis_title, target=None):
-    # Create sample data for the line graph
-    data = pd.DataFrame({
-        'Date': DATES,
-        'Left': np.random.normal(100, 10, len(DATES)),
-        'Right': np.random.normal(100, 10, len(DATES))
-    })
-    
-    # Get the most recent test date
-    latest_date = data['Date'].max()
-    test_date = latest_date.strftime('%d/%m/%Y')
+# Placeholder left/right history arrays per metric title, generated once
+LINE_DATA = {}
+
+# Line graph trace styles: main lines per side, their wide glow underlays, and the shared hover label
+LINE_STYLE_LEFT = dict(color=COLORS['secondary'], width=2)
+LINE_STYLE_RIGHT = dict(color=COLORS['primary'], width=2)
+GLOW_STYLE_LEFT = dict(color=COLORS['secondary'], width=10)
+GLOW_STYLE_RIGHT = dict(color=COLORS['primary'], width=10)
+HOVER_TEMPLATE = '%{y:.1f}'
+
+def sample_line_data(title):
+    """Seeded sample left/right values for a metric's history; the same title always gets the same arrays"""
+    if title not in LINE_DATA:
+        rng = np.random.default_rng(seed=zlib.crc32(title.encode()))
+        # float32 halves the figure's base64 y payload; hover labels show one decimal anyway
+        LINE_DATA[title] = (
+            rng.normal(100, 10, len(DATES)).astype(np.float32),
+            rng.normal(100, 10, len(DATES)).astype(np.float32)
+        )
+    return LINE_DATA[title]
+
+@lru_cache(maxsize=64)
+def build_line_graph(title, yaxis_title, target=None):
+    """Left/right history figure dict for one metric"""
+    # Sample data for the line graph as plain numpy arrays
+    dates_np = DATES_NP
+    left_np, right_np = sample_line_data(title)
     
     # Create line graph
     fig_line = go.Figure()
     
-    # Add glow effect for left
-    for i in range(5, 0, -1):
-        fig_line.add_trace(go.Scatter(
-            x=data['Date'],
-            y=data['Left'],
-            name='',
-            line=dict(color=COLORS['secondary'], width=2*i),
-            opacity=0.1,
-            showlegend=False,
-            hoverinfo='skip'
-        ))
+    # Add glow effect for left: one wide, faint underlay instead of stacked traces
+    fig_line.add_trace(go.Scattergl(
+        x=dates_np,
+        y=left_np,
+        name='',
+        line=GLOW_STYLE_LEFT,
+        opacity=0.15,
+        showlegend=False,
+        hoverinfo='skip'
+    ))
     
     # Add main left trace
-    fig_line.add_trace(go.Scatter(
-        x=data['Date'],
-        y=data['Left'],
+    fig_line.add_trace(go.Scattergl(
+        x=dates_np,
+        y=left_np,
         name='Left',
-        line=dict(color=COLORS['secondary'], width=2),
-        hovertemplate='%{y:.1f}'
+        line=LINE_STYLE_LEFT,
+        hovertemplate=HOVER_TEMPLATE
     ))
     
-    # Add glow effect for right
-    for i in range(5, 0, -1):
-        fig_line.add_trace(go.Scatter(
-            x=data['Date'],
-            y=data['Right'],
-            name='',
-            line=dict(color=COLORS['primary'], width=2*i),
-            opacity=0.1,
-            showlegend=False,
-            hoverinfo='skip'
-        ))
+    # Add glow effect for right: one wide, faint underlay instead of stacked traces
+    fig_line.add_trace(go.Scattergl(
+        x=dates_np,
+        y=right_np,
+        name='',
+        line=GLOW_STYLE_RIGHT,
+        opacity=0.15,
+        showlegend=False,
+        hoverinfo='skip'
+    ))
     
     # Add main right trace
-    fig_line.add_trace(go.Scatter(
-        x=data['Date'],
-        y=data['Right'],
+    fig_line.add_trace(go.Scattergl(
+        x=dates_np,
+        y=right_np,
         name='Right',
-        line=dict(color=COLORS['primary'], width=2),
-        hovertemplate='%{y:.1f}'
+        line=LINE_STYLE_RIGHT,
+        hovertemplate=HOVER_TEMPLATE
     ))
     
     fig_line.update_layout(
@@ -572,7 +306,7 @@ def create_line_graph(title, yaxis_title, target=None):
         margin=dict(l=40, r=40, t=40, b=40),
         plot_bgcolor='white',
         paper_bgcolor='white',
-        font=dict(family="Helvetica, Arial, sans-serif"),
+        font=FIGURE_FONT,
         autosize=True,
         dragmode='pan'
     )
@@ -580,747 +314,221 @@ def create_line_graph(title, yaxis_title, target=None):
     if target:
         fig_line.add_hline(y=target, line_width=2, line_color=COLORS['primary'], opacity=0.5)
     
+    return fig_line.to_dict()
+
+@lru_cache(maxsize=128)
+def title_slug(title):
+    """Component id fragment for a metric or test title, e.g. "Single Leg Squat" -> single-leg-squat"""
+    return title.lower().replace(" ", "-")
+
+def create_line_graph(title, yaxis_title, target=None):
+    fig_line = build_line_graph(title, yaxis_title, target)
     return html.Div([
         dcc.Graph(
-            id=f'graph-{title.lower().replace(" ", "-")}',
+            id=f'graph-{title_slug(title)}',
             figure=fig_line,
-            style={'height': '400px', 'marginBottom': '10px'},
-            config={'responsive': True, 'displayModeBar': False}
+            style=LINE_GRAPH_STYLE,
+            config=LINE_GRAPH_CONFIG
         ),
-        html.Div(f"Last tested: {test_date}", style={
-            'textAlign': 'center',
-            'color': COLORS['text'],
-            'fontSize': '14px',
-            'marginBottom': '20px',
-            'fontFamily': 'Helvetica, Arial, sans-serif',
-            'fontWeight': 'normal',
-            'opacity': '0.8'
-        })
+        create_last_tested(LAST_TEST_DATE)
     ])
 
+# Header with logo, home button, and selection dropdowns; identical on every metric page
+METRIC_HEADER = create_header(create_home_button())
+
+# One prebuilt navigation row per active page
+NAV_ROWS = {
+    active_page: html.Div([
+        create_nav_circle(label, href, page == active_page) for label, href, page in NAV_PAGES
+    ], className="hp-nav-row")
+    for _, _, active_page in NAV_PAGES
+}
+
+# Donut pages: metric data, raw value decimals, whether to show the test date, line graph axis label
+DONUT_PAGES = {
+    'strength': (strength_data, 1, True, "Strength"),
+    'power': (power_data, 1, False, "Power"),
+    'reactive': (reactive_data, 2, False, "Reactive Strength")
+}
+
+# Line-only pages and their metrics
+LINE_PAGES = {
+    'linear': ["10m Sprint", "20m Sprint", "40m Sprint"],
+    'direction': ["505 Test", "T-Test", "Illinois Test"]
+}
+
+def preload_figures():
+    """Build every metric's donut and line figures at import so forked server workers share them"""
+    for metric_data, precision, _, axis_label in DONUT_PAGES.values():
+        for metric, entry in metric_data.items():
+            create_donut_pair(metric, entry, precision)
+            build_line_graph(metric, f"{axis_label} ({entry['unit']})", entry['target'])
+    for metrics in LINE_PAGES.values():
+        for metric in metrics:
+            build_line_graph(metric, "Time (s)", None)
+
+preload_figures()
+
 def create_metric_page(title, active_page):
-    # Initialize dates for dropdown
-    dates = [pd.to_datetime("15/03/2024", format="%d/%m/%Y")]  # Default date
-    
     # Return the capacity page if active_page is "capacity"
     if active_page == "capacity":
         return create_capacity_page(active_page)
 
-    # Create appropriate graphs based on metric type
-    if active_page == "strength":
-        graphs = []
-        for metric in strength_data.keys():
-            # Create a row div containing both donut and line graphs
-            graphs.append(html.Div([
-                html.Div([
-                    create_strength_chart(metric)
-                ], style={'width': '50%', 'display': 'inline-block', 'verticalAlign': 'top'}),
-                html.Div([
-                    create_line_graph(
-                        metric,
-                        f"Strength ({strength_data[metric]['unit']})",
-                        strength_data[metric]['target']
-                    )
-                ], style={'width': '50%', 'display': 'inline-block', 'verticalAlign': 'top'})
-            ], style={'display': 'flex', 'marginBottom': '20px'}))
-    elif active_page == "power":
-        graphs = []
-        for metric in power_data.keys():
-            # Create a row div containing both donut and line graphs
-            graphs.append(html.Div([
-                html.Div([
-                    create_power_chart(metric)
-                ], style={'width': '50%', 'display': 'inline-block', 'verticalAlign': 'top'}),
-                html.Div([
-                    create_line_graph(
-                        metric,
-                        f"Power ({power_data[metric]['unit']})",
-                        power_data[metric]['target']
-                    )
-                ], style={'width': '50%', 'display': 'inline-block', 'verticalAlign': 'top'})
-            ], style={'display': 'flex', 'marginBottom': '20px'}))
-    elif active_page == "reactive":
-        graphs = []
-        for metric in reactive_data.keys():
-            # Create a row div containing both donut and line graphs
-            graphs.append(html.Div([
-                html.Div([
-                    create_reactive_chart(metric)
-                ], style={'width': '50%', 'display': 'inline-block', 'verticalAlign': 'top'}),
-                html.Div([
-                    create_line_graph(
-                        metric,
-                        f"Reactive Strength ({reactive_data[metric]['unit']})",
-                        reactive_data[metric]['target']
-                    )
-                ], style={'width': '50%', 'display': 'inline-block', 'verticalAlign': 'top'})
-            ], style={'display': 'flex', 'marginBottom': '20px'}))
-    elif active_page == "linear":
-        graphs = []
-        metrics = ["10m Sprint", "20m Sprint", "40m Sprint"]
-        for metric in metrics:
-            # Create a row div containing both donut and line graphs
-            graphs.append(html.Div([
-                html.Div([
-                    create_line_graph(
-                        metric,
-                        "Time (s)",
-                        None
-                    )
-                ], style={'width': '100%', 'display': 'inline-block', 'verticalAlign': 'top'})
-            ], style={'display': 'flex', 'marginBottom': '20px'}))
-    elif active_page == "direction":
-        graphs = []
-        metrics = ["505 Test", "T-Test", "Illinois Test"]
-        for metric in metrics:
-            # Create a row div containing both donut and line graphs
-            graphs.append(html.Div([
-                html.Div([
-                    create_line_graph(
-                        metric,
-                        "Time (s)",
-                        None
-                    )
-                ], style={'width': '100%', 'display': 'inline-block', 'verticalAlign': 'top'})
-            ], style={'display': 'flex', 'marginBottom': '20px'}))
+    # Create appropriate graphs based on metric type: one row per metric
+    if active_page in DONUT_PAGES:
+        metric_data, precision, show_test_date, axis_label = DONUT_PAGES[active_page]
+        graphs = [
+            # Donut pair and line graph side by side in a two-column grid
+            html.Div([
+                create_donut_pair(
+                    metric,
+                    entry,
+                    precision,
+                    entry['test_date'] if show_test_date else None
+                ),
+                create_line_graph(
+                    metric,
+                    f"{axis_label} ({entry['unit']})",
+                    entry['target']
+                )
+            ], className="hp-card hp-metric-row")
+            for metric, entry in metric_data.items()
+        ]
+    elif active_page in LINE_PAGES:
+        graphs = [
+            html.Div([create_line_graph(metric, "Time (s)", None)], className="hp-card hp-line-row")
+            for metric in LINE_PAGES[active_page]
+        ]
     else:
         graphs = []
 
     # Return the layout instead of creating a new app
     return html.Div([
-        # Header with logo, home button, and selection dropdowns
-        html.Div([
-            # Left side: Logo
-            html.Div([
-                html.A(
-                    html.Img(
-                        src="/assets/healthia_performance_logo.png",
-                        style={
-                            "height": "220px",
-                            "marginRight": "20px",
-                            "@media (max-width: 768px)": {
-                                "height": "150px"
-                            }
-                        }
-                    ),
-                    href="/",
-                    style={"textDecoration": "none"}
-                )
-            ], style={
-                "display": "flex",
-                "alignItems": "center",
-                "justifyContent": "flex-start",
-                "flex": "1",
-                "@media (max-width: 768px)": {
-                    "justifyContent": "center"
-                }
-            }),
-
-            # Center: Home Button
-            html.Div([
-                html.A(
-                    html.Button("Home", style={
-                        "backgroundColor": COLORS['secondary'],
-                        "color": "white",
-                        "border": "none",
-                        "padding": "12px 24px",
-                        "borderRadius": "8px",
-                        "fontSize": "16px",
-                        "fontWeight": "bold",
-                        "cursor": "pointer",
-                        "fontFamily": "Helvetica, Arial, sans-serif",
-                        "boxShadow": "0 0 35px rgba(0, 188, 212, 0.21), 0 0 25px rgba(0, 188, 212, 0.14), 0 0 15px rgba(0, 188, 212, 0.105)",
-                        "@media (max-width: 768px)": {
-                            "padding": "8px 16px",
-                            "fontSize": "14px"
-                        }
-                    }, className="home-button"),
-                    href="/",
-                    style={"textDecoration": "none"}
-                )
-            ], style={
-                "display": "flex",
-                "alignItems": "center",
-                "justifyContent": "center",
-                "position": "absolute",
-                "left": "50%",
-                "transform": "translateX(-50%)",
-                "@media (max-width: 768px)": {
-                    "position": "static",
-                    "transform": "none",
-                    "margin": "10px 0"
-                }
-            }),
-
-            # Right side: Athlete and Date Selection
-            html.Div([
-                dcc.Store(id='selected-athlete', storage_type='session'),
-                dcc.Store(id='selected-date', storage_type='session'),
-                html.Div([
-                    dcc.Dropdown(
-                        id='athlete-dropdown',
-                        options=[
-                            {'label': 'Athlete 1', 'value': 'athlete1'},
-                            {'label': 'Athlete 2', 'value': 'athlete2'},
-                            {'label': 'Athlete 3', 'value': 'athlete3'}
-                        ],
-                        placeholder="Select an Athlete",
-                        persistence=True,
-                        persistence_type='session',
-                        style={
-                            "width": "200px",
-                            "marginRight": "20px",
-                            "fontFamily": "Helvetica, Arial, sans-serif",
-                            "borderRadius": "8px",
-                            "border": f"2px solid {COLORS['secondary']}",
-                            "boxShadow": "0 0 35px rgba(0, 188, 212, 0.21), 0 0 25px rgba(0, 188, 212, 0.14), 0 0 15px rgba(0, 188, 212, 0.105)",
-                            "backgroundColor": "white",
-                            "backgroundImage": "linear-gradient(to bottom, rgba(255,255,255,0.9), rgba(255,255,255,1))",
-                            "transition": "all 0.3s ease",
-                            "@media (max-width: 768px)": {
-                                "width": "150px",
-                                "marginRight": "10px"
-                            }
-                        }
-                    ),
-                    dcc.Dropdown(
-                        id='date-dropdown',
-                        options=[{'label': date.strftime('%d/%m/%Y'), 'value': date} for date in DATES],
-                        value=DATES[-1],
-                        persistence=True,
-                        persistence_type='session',
-                        style={
-                            "width": "200px",
-                            "fontFamily": "Helvetica, Arial, sans-serif",
-                            "borderRadius": "8px",
-                            "border": f"2px solid {COLORS['secondary']}",
-                            "boxShadow": "0 0 35px rgba(0, 188, 212, 0.21), 0 0 25px rgba(0, 188, 212, 0.14), 0 0 15px rgba(0, 188, 212, 0.105)",
-                            "backgroundColor": "white",
-                            "backgroundImage": "linear-gradient(to bottom, rgba(255,255,255,0.9), rgba(255,255,255,1))",
-                            "transition": "all 0.3s ease",
-                            "@media (max-width: 768px)": {
-                                "width": "150px"
-                            }
-                        }
-                    )
-                ], style={
-                    "display": "flex",
-                    "alignItems": "center",
-                    "justifyContent": "flex-end",
-                    "@media (max-width: 768px)": {
-                        "justifyContent": "center"
-                    }
-                })
-            ], style={
-                "display": "flex",
-                "alignItems": "center",
-                "justifyContent": "flex-end",
-                "flex": "1",
-                "@media (max-width: 768px)": {
-                    "justifyContent": "center"
-                }
-            })
-        ], style={
-            "display": "flex",
-            "alignItems": "center",
-            "justifyContent": "space-between",
-            "marginBottom": "40px",
-            "padding": "20px",
-            "backgroundColor": "white",
-            "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.1)",
-            "borderRadius": "12px",
-            "position": "relative",
-            "@media (max-width: 768px)": {
-                "flexDirection": "column",
-                "alignItems": "center"
-            }
-        }),
+        METRIC_HEADER,
 
         # Navigation Circles - Single Row
-        html.Div([
-            create_nav_circle("Capacity / Motor Control", "/capacity", active_page == "capacity"),
-            create_nav_circle("Strength / Hypertrophy", "/strength", active_page == "strength"),
-            create_nav_circle("Power / RFD (Slow SSC)", "/power", active_page == "power"),
-            create_nav_circle("Reactive Strength (Fast SSC)", "/reactive", active_page == "reactive"),
-            create_nav_circle("Linear Running", "/linear", active_page == "linear"),
-            create_nav_circle("Change of Direction", "/direction", active_page == "direction")
-        ], style={
-            "display": "flex",
-            "justifyContent": "center",
-            "alignItems": "center",
-            "flexWrap": "nowrap",
-            "gap": "20px",
-            "maxWidth": "100%",
-            "margin": "0 auto",
-            "padding": "20px",
-            "overflowX": "auto",
-            "backgroundColor": "white",
-            "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.1)",
-            "borderRadius": "12px",
-            "-webkit-overflow-scrolling": "touch",  # Smooth scrolling on iOS
-            "@media (max-width: 768px)": {
-                "gap": "10px",
-                "padding": "10px"
-            }
-        }),
+        NAV_ROWS[active_page],
 
-        # Graphs Container
-        html.Div([
-            html.Div([
-                graph
-            ], style={
-                'width': '100%',
-                'backgroundColor': 'white',
-                'padding': '20px',
-                'borderRadius': '12px',
-                'boxShadow': '0 2px 4px rgba(0, 0, 0, 0.1)',
-                'marginBottom': '20px',
-                '@media (max-width: 768px)': {
-                    'padding': '10px'
-                }
-            }) for graph in graphs
-        ], style={
-            'maxWidth': '1200px',
-            'margin': '0 auto',
-            'padding': '20px',
-            '@media (max-width: 768px)': {
-                'padding': '10px'
-            }
-        })
-    ], style={
-        "backgroundColor": "#f5f5f5",
-        "minHeight": "100vh",
-        "padding": "40px 20px",
-        "@media (max-width: 768px)": {
-            "padding": "20px 10px"
-        }
-    })
+        # Graphs Container: one card per metric row
+        html.Div(graphs, className="hp-graphs")
+    ], className="hp-page")
 
-def create_pictogram_chart(title, left_reps, right_reps):
-    # Determine max reps based on exercise type
+# Maximum reps shown per pictogram: filled dots for completed reps, faded dots for the remainder
+def pictogram_max_reps(title):
     if "Calf" in title:
-        max_reps = 30
+        return 30
     elif "Push-ups" in title:
-        max_reps = 25
+        return 25
     elif "Chin-ups" in title:
-        max_reps = 12
+        return 12
     else:  # For bridges and sit to stand
-        max_reps = 25
-
-    # Create a list of icons (filled or unfilled) based on repetitions
-    def create_icon_row(reps, side):
-        # Calculate remaining capacity (only show if under max)
-        remaining = max(0, max_reps - reps)
-        
-        # Create all dots (filled + remaining capacity)
-        all_dots = []
-        for i in range(reps + remaining):
-            # Use secondary (cyan) for left and primary (dark slate) for right
-            fill_color = COLORS['secondary'] if side == "Left" else COLORS['primary']
-            icon_color = fill_color if i < reps else 'rgba(0, 188, 212, 0.2)' if side == "Left" else 'rgba(69, 90, 100, 0.2)'
-            all_dots.append(
-                html.Div("●", style={
-                    "color": icon_color,
-                    "fontSize": "22.8px",
-                    "display": "inline-block",
-                    "marginRight": "4px",
-                    "lineHeight": "1"
-                })
-            )
-        
-        # Split dots into rows of 10
-        rows = []
-        for i in range(0, len(all_dots), 10):
-            row_dots = all_dots[i:i+10]
-            rows.append(
-                html.Div(row_dots, style={
-                    "display": "flex",
-                    "flexWrap": "nowrap",
-                    "gap": "2px",
-                    "marginBottom": "8px"
-                })
-            )
+        return 25
 
-        return html.Div([
-            html.Div(f"{side}: {reps}", style={
-                "fontSize": "19px",
-                "fontWeight": "bold",
-                "marginBottom": "8px",
-                "color": fill_color
-            }),
-            html.Div(rows)
-        ])
+def pictogram_id(title):
+    return f'pictogram-{title_slug(title)}'
 
+# Pictogram card shell; the dot rows and "Last tested" line are rendered in the browser by
+# assets/capacity.js from the capacity-data store (styled in assets/capacity.css)
+def create_pictogram_chart(title):
     return html.Div([
-        html.H3(title, style={
-            "textAlign": "center",
-            "color": COLORS['text'],
-            "fontSize": "22.8px",
-            "marginBottom": "19px"
-        }),
-        create_icon_row(left_reps, "Left"),
-        create_icon_row(right_reps, "Right")
-    ], style={
-        "backgroundColor": "white",
-        "padding": "19px",
-        "borderRadius": "12px",
-        "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.1)",
-        "margin": "19px 0",
-        "width": "95%",
-        "maxWidth": "95%"
-    })
+        html.Div([
+            html.H3(title, className="pictogram-title"),
+            html.Div(id=pictogram_id(title))
+        ], className="pictogram-card"),
+        html.Div(id=f"{pictogram_id(title)}-tested", className="pictogram-tested")
+    ])
 
-def create_capacity_page(active_page):
-    # Define historical data for each exercise
-    historical_data = {
-        # Lower Limb Tests
-        'Single Leg Calf Raises': {
-            '2023-01-01': {'left': 15, 'right': 13},
-            '2023-02-01': {'left': 17, 'right': 15},
-            '2023-03-01': {'left': 19, 'right': 17},
-            '2023-04-01': {'left': 21, 'right': 19},
-            '2023-05-01': {'left': 23, 'right': 21},
-            '2023-06-01': {'left': 25, 'right': 23},
-            '2023-07-01': {'left': 27, 'right': 25},
-            '2023-08-01': {'left': 28, 'right': 26},
-            '2023-09-01': {'left': 28, 'right': 26},
-            '2023-10-01': {'left': 28, 'right': 26},
-            '2023-11-01': {'left': 28, 'right': 26},
-            '2023-12-01': {'left': 28, 'right': 26}
-        },
-        'Single Leg Bridge': {
-            '2023-01-01': {'left': 12, 'right': 10},
-            '2023-02-01': {'left': 14, 'right': 12},
-            '2023-03-01': {'left': 16, 'right': 14},
-            '2023-04-01': {'left': 18, 'right': 16},
-            '2023-05-01': {'left': 20, 'right': 18},
-            '2023-06-01': {'left': 22, 'right': 20},
-            '2023-07-01': {'left': 24, 'right': 22},
-            '2023-08-01': {'left': 26, 'right': 24},
-            '2023-09-01': {'left': 28, 'right': 26},
-            '2023-10-01': {'left': 28, 'right': 26},
-            '2023-11-01': {'left': 28, 'right': 26},
-            '2023-12-01': {'left': 28, 'right': 26}
-        },
-        'Single Leg Squat': {
-            '2023-01-01': {'left': 8, 'right': 6},
-            '2023-02-01': {'left': 10, 'right': 8},
-            '2023-03-01': {'left': 12, 'right': 10},
-            '2023-04-01': {'left': 14, 'right': 12},
-            '2023-05-01': {'left': 16, 'right': 14},
-            '2023-06-01': {'left': 18, 'right': 16},
-            '2023-07-01': {'left': 20, 'right': 18},
-            '2023-08-01': {'left': 22, 'right': 20},
-            '2023-09-01': {'left': 24, 'right': 22},
-            '2023-10-01': {'left': 24, 'right': 22},
-            '2023-11-01': {'left': 24, 'right': 22},
-            '2023-12-01': {'left': 24, 'right': 22}
-        },
-        # Upper Limb Tests
-        'Push-ups': {
-            '2023-01-01': {'left': 15, 'right': 15},
-            '2023-02-01': {'left': 16, 'right': 16},
-            '2023-03-01': {'left': 17, 'right': 17},
-            '2023-04-01': {'left': 18, 'right': 18},
-            '2023-05-01': {'left': 19, 'right': 19},
-            '2023-06-01': {'left': 20, 'right': 20},
-            '2023-07-01': {'left': 21, 'right': 21},
-            '2023-08-01': {'left': 22, 'right': 22},
-            '2023-09-01': {'left': 23, 'right': 23},
-            '2023-10-01': {'left': 24, 'right': 24},
-            '2023-11-01': {'left': 24, 'right': 24},
-            '2023-12-01': {'left': 24, 'right': 24}
-        },
-        'Chin-ups': {
-            '2023-01-01': {'left': 5, 'right': 5},
-            '2023-02-01': {'left': 6, 'right': 6},
-            '2023-03-01': {'left': 6, 'right': 6},
-            '2023-04-01': {'left': 7, 'right': 7},
-            '2023-05-01': {'left': 7, 'right': 7},
-            '2023-06-01': {'left': 8, 'right': 8},
-            '2023-07-01': {'left': 8, 'right': 8},
-            '2023-08-01': {'left': 9, 'right': 9},
-            '2023-09-01': {'left': 9, 'right': 9},
-            '2023-10-01': {'left': 10, 'right': 10},
-            '2023-11-01': {'left': 10, 'right': 10},
-            '2023-12-01': {'left': 10, 'right': 10}
-        }
+# Capacity test history per exercise as parallel arrays: ascending test dates and the left/right reps on each
+HISTORICAL_DATA = {
+    # Lower Limb Tests
+    'Single Leg Calf Raises': {
+        'dates': [
+            '2023-01-01', '2023-02-01', '2023-03-01', '2023-04-01',
+            '2023-05-01', '2023-06-01', '2023-07-01', '2023-08-01',
+            '2023-09-01', '2023-10-01', '2023-11-01', '2023-12-01'
+        ],
+        'left': [15, 17, 19, 21, 23, 25, 27, 28, 28, 28, 28, 28],
+        'right': [13, 15, 17, 19, 21, 23, 25, 26, 26, 26, 26, 26]
+    },
+    'Single Leg Bridge': {
+        'dates': [
+            '2023-01-01', '2023-02-01', '2023-03-01', '2023-04-01',
+            '2023-05-01', '2023-06-01', '2023-07-01', '2023-08-01',
+            '2023-09-01', '2023-10-01', '2023-11-01', '2023-12-01'
+        ],
+        'left': [12, 14, 16, 18, 20, 22, 24, 26, 28, 28, 28, 28],
+        'right': [10, 12, 14, 16, 18, 20, 22, 24, 26, 26, 26, 26]
+    },
+    'Single Leg Squat': {
+        'dates': [
+            '2023-01-01', '2023-02-01', '2023-03-01', '2023-04-01',
+            '2023-05-01', '2023-06-01', '2023-07-01', '2023-08-01',
+            '2023-09-01', '2023-10-01', '2023-11-01', '2023-12-01'
+        ],
+        'left': [8, 10, 12, 14, 16, 18, 20, 22, 24, 24, 24, 24],
+        'right': [6, 8, 10, 12, 14, 16, 18, 20, 22, 22, 22, 22]
+    },
+    # Upper Limb Tests
+    'Push-ups': {
+        'dates': [
+            '2023-01-01', '2023-02-01', '2023-03-01', '2023-04-01',
+            '2023-05-01', '2023-06-01', '2023-07-01', '2023-08-01',
+            '2023-09-01', '2023-10-01', '2023-11-01', '2023-12-01'
+        ],
+        'left': [15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 24, 24],
+        'right': [15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 24, 24]
+    },
+    'Chin-ups': {
+        'dates': [
+            '2023-01-01', '2023-02-01', '2023-03-01', '2023-04-01',
+            '2023-05-01', '2023-06-01', '2023-07-01', '2023-08-01',
+            '2023-09-01', '2023-10-01', '2023-11-01', '2023-12-01'
+        ],
+        'left': [5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10, 10],
+        'right': [5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10, 10]
     }
+}
 
-    # Create list of all unique dates from historical data
-    all_dates = sorted(set(date for exercise_data in historical_data.values() for date in exercise_data.keys()))
-    dates = [pd.to_datetime(date) for date in all_dates]
+# Capacity tests per section
+LOWER_LIMB_TESTS = ('Single Leg Calf Raises', 'Single Leg Bridge', 'Single Leg Squat')
+UPPER_LIMB_TESTS = ('Push-ups', 'Chin-ups')
 
-    # Function to get the latest data based on selected date
-    def get_latest_data(exercise, selected_date):
-        # Convert selected_date to string format if it's a datetime
-        if isinstance(selected_date, pd.Timestamp):
-            selected_date = selected_date.strftime('%Y-%m-%d')
-        
-        # Get all dates for this exercise
-        exercise_dates = sorted(historical_data[exercise].keys())
-        
-        # Find the most recent date that's not after the selected date
-        latest_valid_date = None
-        for date in exercise_dates:
-            if date <= selected_date:
-                latest_valid_date = date
-            else:
-                break
-        
-        # Return the data from the most recent valid date, or the earliest date if none found
-        if latest_valid_date:
-            return historical_data[exercise][latest_valid_date]
-        return historical_data[exercise][exercise_dates[0]]
+# Every test date across exercises for the date dropdown: a linear merge of the already sorted
+# per-exercise dates, with repeats dropped in order
+MERGED_TEST_DATES = dict.fromkeys(merge(*(exercise_data['dates'] for exercise_data in HISTORICAL_DATA.values())))
+CAPACITY_DATES = [date.fromisoformat(day) for day in MERGED_TEST_DATES]
+CAPACITY_DATE_OPTIONS = [{'label': day.strftime('%d/%m/%Y'), 'value': day.isoformat()} for day in CAPACITY_DATES]
+CAPACITY_DATE_LAST = CAPACITY_DATES[-1].isoformat()
 
-    # Create pictogram charts for each exercise
-    def create_charts(selected_date):
-        # Separate lower and upper limb tests
-        lower_limb_tests = ['Single Leg Calf Raises', 'Single Leg Bridge', 'Single Leg Squat']
-        upper_limb_tests = ['Push-ups', 'Chin-ups']
-        
-        lower_limb_charts = []
-        upper_limb_charts = []
-        
-        # Create lower limb charts
-        for exercise in lower_limb_tests:
-            latest_data = get_latest_data(exercise, selected_date)
-            test_date = None
-            for date in sorted(historical_data[exercise].keys(), reverse=True):
-                if date <= selected_date:
-                    test_date = pd.to_datetime(date).strftime('%d/%m/%Y')
-                    break
-            lower_limb_charts.append(
-                html.Div([
-                    create_pictogram_chart(
-                        exercise,
-                        latest_data['left'],
-                        latest_data['right']
-                    ),
-                    html.Div(f"Last tested: {test_date}", style={
-                        'textAlign': 'center',
-                        'color': COLORS['text'],
-                        'fontSize': '14px',
-                        'marginTop': '10px',
-                        'fontFamily': 'Helvetica, Arial, sans-serif',
-                        'fontWeight': 'normal',
-                        'opacity': '0.8'
-                    })
-                ])
-            )
-        
-        # Create upper limb charts
-        for exercise in upper_limb_tests:
-            latest_data = get_latest_data(exercise, selected_date)
-            test_date = None
-            for date in sorted(historical_data[exercise].keys(), reverse=True):
-                if date <= selected_date:
-                    test_date = pd.to_datetime(date).strftime('%d/%m/%Y')
-                    break
-            upper_limb_charts.append(
-                html.Div([
-                    create_pictogram_chart(
-                        exercise,
-                        latest_data['left'],
-                        latest_data['right']
-                    ),
-                    html.Div(f"Last tested: {test_date}", style={
-                        'textAlign': 'center',
-                        'color': COLORS['text'],
-                        'fontSize': '14px',
-                        'marginTop': '10px',
-                        'fontFamily': 'Helvetica, Arial, sans-serif',
-                        'fontWeight': 'normal',
-                        'opacity': '0.8'
-                    })
-                ])
-            )
-        
-        return {
-            'lower_limb': lower_limb_charts,
-            'upper_limb': upper_limb_charts
-        }
-
-    # Default to the most recent date
-    default_date = dates[-1]
-    charts = create_charts(default_date.strftime('%Y-%m-%d'))
+# Every capacity test in page order, and the compact per-test history the pictograms are drawn from
+CAPACITY_TESTS = LOWER_LIMB_TESTS + UPPER_LIMB_TESTS
+CAPACITY_STORE_DATA = [{**HISTORICAL_DATA[exercise], 'max': pictogram_max_reps(exercise)} for exercise in CAPACITY_TESTS]
 
+# Capacity section: heading over a wrapping row of pictogram shells, filled in for the
+# selected date by the renderPictograms callback
+def create_capacity_section(heading, exercises):
     return html.Div([
-        # Header with logo and selection dropdowns
-        html.Div([
-            # Left side: Logo
-            html.Div([
-                html.Img(
-                    src="/assets/healthia_performance_logo.png",
-                    style={
-                        "height": "220px",
-                        "marginRight": "20px"
-                    }
-                )
-            ], style={
-                "display": "flex",
-                "alignItems": "center",
-                "justifyContent": "flex-start",
-                "flex": "1"
-            }),
+        html.H2(heading, className="capacity-heading"),
+        html.Div([create_pictogram_chart(exercise) for exercise in exercises], className="capacity-section")
+    ])
 
-            # Center: Title
-            html.Div([
-                html.H1("Capacity Metrics", style={
-                    "color": COLORS['text'],
-                    "fontSize": "36px",
-                    "fontWeight": "bold",
-                    "margin": "0",
-                    "fontFamily": "Helvetica, Arial, sans-serif",
-                    "letterSpacing": "0.5px",
-                    "textAlign": "center"
-                })
-            ], style={
-                "display": "flex",
-                "alignItems": "center",
-                "justifyContent": "center",
-                "flex": "1",
-                "position": "relative",
-                "left": "-50px"
-            }),
+# Capacity page header with its own title and test dates, and its two test sections; built once
+# and shared by every render. Layout and responsive rules live in assets/capacity.css.
+CAPACITY_HEADER = create_header(create_title("Capacity Metrics"), CAPACITY_DATE_OPTIONS, CAPACITY_DATE_LAST)
 
-            # Right side: Athlete and Date Selection
-            html.Div([
-                dcc.Store(id='selected-athlete', storage_type='session'),
-                dcc.Store(id='selected-date', storage_type='session'),
-                html.Div([
-                    dcc.Dropdown(
-                        id='athlete-dropdown',
-                        options=[
-                            {'label': 'Athlete 1', 'value': 'athlete1'},
-                            {'label': 'Athlete 2', 'value': 'athlete2'},
-                            {'label': 'Athlete 3', 'value': 'athlete3'}
-                        ],
-                        placeholder="Select an Athlete",
-                        persistence=True,
-                        persistence_type='session',
-                        style={
-                            "width": "200px",
-                            "marginRight": "20px",
-                            "fontFamily": "Helvetica, Arial, sans-serif",
-                            "borderRadius": "8px",
-                            "border": f"2px solid {COLORS['secondary']}",
-                            "boxShadow": "0 0 35px rgba(0, 188, 212, 0.21), 0 0 25px rgba(0, 188, 212, 0.14), 0 0 15px rgba(0, 188, 212, 0.105)",
-                            "backgroundColor": "white",
-                            "backgroundImage": "linear-gradient(to bottom, rgba(255,255,255,0.9), rgba(255,255,255,1))",
-                            "transition": "all 0.3s ease"
-                        }
-                    ),
-                    dcc.Dropdown(
-                        id='date-dropdown',
-                        options=[{'label': date.strftime('%d/%m/%Y'), 'value': date} for date in dates],
-                        value=default_date,
-                        persistence=True,
-                        persistence_type='session',
-                        style={
-                            "width": "200px",
-                            "fontFamily": "Helvetica, Arial, sans-serif",
-                            "borderRadius": "8px",
-                            "border": f"2px solid {COLORS['secondary']}",
-                            "boxShadow": "0 0 35px rgba(0, 188, 212, 0.21), 0 0 25px rgba(0, 188, 212, 0.14), 0 0 15px rgba(0, 188, 212, 0.105)",
-                            "backgroundColor": "white",
-                            "backgroundImage": "linear-gradient(to bottom, rgba(255,255,255,0.9), rgba(255,255,255,1))",
-                            "transition": "all 0.3s ease"
-                        }
-                    )
-                ], style={
-                    "display": "flex",
-                    "alignItems": "center",
-                    "justifyContent": "flex-end"
-                })
-            ], style={
-                "display": "flex",
-                "alignItems": "center",
-                "justifyContent": "flex-end",
-                "flex": "1"
-            })
-        ], style={
-            "display": "flex",
-            "alignItems": "center",
-            "justifyContent": "space-between",
-            "marginBottom": "40px",
-            "padding": "20px",
-            "backgroundColor": "white",
-            "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.1)",
-            "borderRadius": "12px",
-            "position": "relative"
-        }),
+CAPACITY_SECTIONS = [
+    create_capacity_section("Lower Limb Tests", LOWER_LIMB_TESTS),
+    create_capacity_section("Upper Limb Tests", UPPER_LIMB_TESTS)
+]
 
-        # Navigation Circles - Single Row
-        html.Div([
-            create_nav_circle("Capacity / Motor Control", "/capacity", active_page == "capacity"),
-            create_nav_circle("Strength / Hypertrophy", "/strength", active_page == "strength"),
-            create_nav_circle("Power / RFD (Slow SSC)", "/power", active_page == "power"),
-            create_nav_circle("Reactive Strength (Fast SSC)", "/reactive", active_page == "reactive"),
-            create_nav_circle("Linear Running", "/linear", active_page == "linear"),
-            create_nav_circle("Change of Direction", "/direction", active_page == "direction")
-        ], style={
-            "display": "flex",
-            "justifyContent": "center",
-            "alignItems": "center",
-            "flexWrap": "nowrap",
-            "gap": "20px",
-            "maxWidth": "100%",
-            "margin": "0 auto",
-            "padding": "20px",
-            "overflowX": "auto",
-            "backgroundColor": "white",
-            "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.1)",
-            "borderRadius": "12px"
-        }),
+def create_capacity_page(active_page):
+    return html.Div([
+        dcc.Store(id='capacity-data', data=CAPACITY_STORE_DATA),
+        CAPACITY_HEADER,
 
-        # Lower Limb Tests Section
-        html.Div([
-            html.H2("Lower Limb Tests", style={
-                "color": COLORS['text'],
-                "fontSize": "28px",
-                "fontWeight": "bold",
-                "marginBottom": "20px",
-                "textAlign": "center"
-            }),
-            html.Div(charts['lower_limb'], style={
-                "display": "flex",
-                "justifyContent": "center",
-                "alignItems": "flex-start",
-                "flexWrap": "wrap",
-                "gap": "20px",
-                "margin": "20px auto",
-                "padding": "20px",
-                "backgroundColor": "white",
-                "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.1)",
-                "borderRadius": "12px"
-            })
-        ]),
+        # Navigation Circles - Single Row
+        NAV_ROWS[active_page],
 
-        # Upper Limb Tests Section
-        html.Div([
-            html.H2("Upper Limb Tests", style={
-                "color": COLORS['text'],
-                "fontSize": "28px",
-                "fontWeight": "bold",
-                "marginBottom": "20px",
-                "textAlign": "center"
-            }),
-            html.Div(charts['upper_limb'], style={
-                "display": "flex",
-                "justifyContent": "center",
-                "alignItems": "flex-start",
-                "flexWrap": "wrap",
-                "gap": "20px",
-                "margin": "20px auto",
-                "padding": "20px",
-                "backgroundColor": "white",
-                "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.1)",
-                "borderRadius": "12px"
-            })
-        ])
-    ], style={
-        "backgroundColor": "#f5f5f5",
-        "minHeight": "100vh",
-        "padding": "40px 20px"
-    }) 
\ No newline at end of file
+        # Lower and Upper Limb Tests Sections
+        *CAPACITY_SECTIONS
+    ], className="hp-page") 
\ No newline at end of file
@@ -1,15 +1,31 @@
 import dash
 from dash import html, dcc
-from dash.dependencies import Input, Output
-import pandas as pd
+from dash.dependencies import Input, Output, State, ClientsideFunction
+import plotly.io as pio
 from datetime import datetime
 from NavigationDashboard import create_navigation_dashboard
-from MetricPage import create_metric_page
+from MetricPage import create_metric_page, CAPACITY_TESTS, pictogram_id
+
+# Serialize layouts with orjson (see requirements.txt); Dash encodes page content through plotly.io's JSON engine
+pio.json.config.default_engine = "orjson"
+
+# The index page shell (script and stylesheet tags, config, custom CSS) only changes when assets
+# do, so without hot reload it is rendered on the first request and reused afterwards
+class CachedIndexDash(dash.Dash):
+    index_html = None
+
+    def index(self, *args, **kwargs):
+        if self._dev_tools.hot_reload:
+            return super().index(*args, **kwargs)
+        if self.index_html is None:
+            self.index_html = super().index(*args, **kwargs)
+        return self.index_html
 
 # Add custom CSS for animations
-app = dash.Dash(
+app = CachedIndexDash(
     __name__, 
     suppress_callback_exceptions=True,
+    compress=True,  # gzip/brotli responses through Flask-Compress (requirements.txt)
     assets_folder='assets',
     index_string='''
     <!DOCTYPE html>
@@ -88,31 +104,41 @@ app.layout = html.Div([
     html.Div(id='page-content', className='page-content')
 ])
 
+# Metric page routes: pathname -> (title, active page)
+PAGE_ROUTES = {
+    '/capacity': ("Capacity / Motor Control", "capacity"),
+    '/strength': ("Strength / Hypertrophy", "strength"),
+    '/power': ("Power / RFD", "power"),
+    '/reactive': ("Reactive Strength", "reactive"),
+    '/linear': ("Linear Running", "linear"),
+    '/direction': ("Change of Direction", "direction")
+}
+
+# Every page layout, built once at import; unknown paths fall back to the navigation dashboard
+PAGES = {
+    '/': create_navigation_dashboard('/'),
+    **{path: create_metric_page(title, page) for path, (title, page) in PAGE_ROUTES.items()}
+}
+
 # Callback to handle routing
 @app.callback(
     Output('page-content', 'children'),
     [Input('url', 'pathname')]
 )
 def display_page(pathname):
-    if not pathname:
-        pathname = '/'
-        
-    if pathname == '/':
-        return create_navigation_dashboard(pathname)
-    elif pathname == '/capacity':
-        return create_metric_page("Capacity / Motor Control", "capacity")
-    elif pathname == '/strength':
-        return create_metric_page("Strength / Hypertrophy", "strength")
-    elif pathname == '/power':
-        return create_metric_page("Power / RFD", "power")
-    elif pathname == '/reactive':
-        return create_metric_page("Reactive Strength", "reactive")
-    elif pathname == '/linear':
-        return create_metric_page("Linear Running", "linear")
-    elif pathname == '/direction':
-        return create_metric_page("Change of Direction", "direction")
-    else:
-        return create_navigation_dashboard(pathname)
+    return PAGES.get(pathname, PAGES['/'])
+
+# Capacity pictograms are drawn in the browser (assets/capacity.js) for the selected date
+app.clientside_callback(
+    ClientsideFunction(namespace='capacity', function_name='renderPictograms'),
+    [
+        output
+        for exercise in CAPACITY_TESTS
+        for output in (Output(pictogram_id(exercise), 'children'), Output(f"{pictogram_id(exercise)}-tested", 'children'))
+    ],
+    Input('date-dropdown', 'value'),
+    State('capacity-data', 'data')
+)
 
 if __name__ == '__main__':
     # Development settings
@@ -0,0 +1,70 @@
+// Capacity page pictograms, rendered in the browser from the capacity-data store
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    capacity: {
+        renderPictograms: function(selectedDate, tests) {
+            if (!tests) {
+                return window.dash_clientside.no_update;
+            }
+
+            function element(type, children, className) {
+                return {
+                    type: type,
+                    namespace: 'dash_html_components',
+                    props: {children: children, className: className}
+                };
+            }
+
+            function div(children, className) {
+                return element('Div', children, className);
+            }
+
+            // Dots (filled + remaining capacity) split into rows of 10; each row is at most
+            // two text spans of dots rather than one component per dot
+            function iconRow(reps, max, side) {
+                const total = Math.max(reps, max);
+                const rows = [];
+                for (let start = 0; start < total; start += 10) {
+                    const end = Math.min(start + 10, total);
+                    const filled = Math.max(0, Math.min(reps, end) - start);
+                    const spans = [];
+                    if (filled > 0) {
+                        spans.push(element('Span', '●'.repeat(filled), 'pictogram-dots'));
+                    }
+                    if (end - start > filled) {
+                        spans.push(element('Span', '●'.repeat(end - start - filled), 'pictogram-dots pictogram-dots-faded'));
+                    }
+                    rows.push(div(spans, 'pictogram-row'));
+                }
+                return div([
+                    div(side + ': ' + reps, 'pictogram-label'),
+                    div(rows)
+                ], 'pictogram-' + side.toLowerCase());
+            }
+
+            const outputs = [];
+            tests.forEach(function(test) {
+                const dates = test.dates;
+                const day = selectedDate ? String(selectedDate).slice(0, 10) : dates[dates.length - 1];
+
+                // Most recent test not after the selected date (bisect right), else the earliest
+                let lo = 0, hi = dates.length;
+                while (lo < hi) {
+                    const mid = (lo + hi) >> 1;
+                    if (day < dates[mid]) { hi = mid; } else { lo = mid + 1; }
+                }
+                const idx = lo - 1;
+                const shown = Math.max(idx, 0);
+                const tested = idx >= 0
+                    ? dates[idx].slice(8, 10) + '/' + dates[idx].slice(5, 7) + '/' + dates[idx].slice(0, 4)
+                    : 'None';
+
+                outputs.push([
+                    iconRow(test.left[shown], test.max, 'Left'),
+                    iconRow(test.right[shown], test.max, 'Right')
+                ]);
+                outputs.push('Last tested: ' + tested);
+            });
+            return outputs;
+        }
+    }
+});